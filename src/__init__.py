@@ -23,17 +23,25 @@ bl_info = {
 
 import bpy
 import bmesh
+import numpy as np
 from bpy.types import Operator, Panel, PropertyGroup
 from bpy.props import FloatProperty, PointerProperty, CollectionProperty, BoolProperty, StringProperty, IntProperty, EnumProperty
 from bpy_extras.io_utils import ExportHelper
 from mathutils import Vector, Matrix, geometry
 import mathutils
 import os
+import json
+import time
+import zlib
+import shutil
+import subprocess
+import tempfile
 from bpy.app import tempdir
 from statistics import mean, stdev
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from math import sqrt, pi, isclose
 from mathutils.geometry import area_tri
+from mathutils.bvhtree import BVHTree
 import mathutils
 import math
 
@@ -121,12 +129,10 @@ class OBJECT_OT_CreateVertexColorLayers(Operator):
             # Crea i singoli canali RGBA se non esistono
             color_layers = ["vertex_R", "vertex_G", "vertex_B", "vertex_A"]
             for color_layer_name in color_layers:
-                if color_layer_name not in obj.data.vertex_colors:
-                    obj.data.vertex_colors.new(name=color_layer_name)
+                ensure_color_attribute(obj.data, color_layer_name, context.scene.vertex_color_domain)
             
             # Crea il layer RGBA combinato se non esiste
-            if "vertex_RGBA" not in obj.data.vertex_colors:
-                obj.data.vertex_colors.new(name="vertex_RGBA")
+            ensure_color_attribute(obj.data, "vertex_RGBA", context.scene.vertex_color_domain)
             
             # Imposta vertex_RGBA come layer di rendering attivo per l'oggetto corrente
             bpy.ops.geometry.color_attribute_render_set(name="vertex_RGBA")
@@ -137,6 +143,54 @@ class OBJECT_OT_CreateVertexColorLayers(Operator):
         self.report({'INFO'}, "Vertex color layers creati con successo")
         return {'FINISHED'}
 
+def ensure_color_attribute(mesh, name, domain='CORNER'):
+    """Return the named color attribute, creating it as a byte color on the given domain if missing."""
+    attribute = mesh.color_attributes.get(name)
+    if attribute is None:
+        attribute = mesh.color_attributes.new(name=name, type='BYTE_COLOR', domain=domain)
+    return attribute
+
+def read_color_channel(mesh, layer, domain, channel=0):
+    """Read one channel of a color layer, converted to the requested domain (corner values are averaged per point)."""
+    layer_domain = getattr(layer, 'domain', 'CORNER')
+    color = np.empty(len(layer.data) * 4, dtype=np.float32)
+    layer.data.foreach_get("color", color)
+    values = color[channel::4]
+    
+    if layer_domain == domain:
+        return values
+    
+    loop_vert = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vert)
+    if domain == 'CORNER':
+        return values[loop_vert]
+    
+    vertex_count = len(mesh.vertices)
+    totals = np.bincount(loop_vert, weights=values, minlength=vertex_count)
+    counts = np.bincount(loop_vert, minlength=vertex_count)
+    return (totals / np.maximum(counts, 1)).astype(np.float32)
+
+def write_color_channel(mesh, layer, values):
+    """Write per-vertex values into a color layer as grayscale with a single foreach_set."""
+    if getattr(layer, 'domain', 'CORNER') == 'CORNER':
+        loop_vert = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vert)
+        values = values[loop_vert]
+    
+    color = np.ones((len(values), 4), dtype=np.float32)
+    color[:, :3] = values[:, None]
+    layer.data.foreach_set("color", color.ravel())
+
+def combine_vertex_color_channels(mesh, rgba_layer, channel_layers):
+    """Write the first channel of each of the four layers into the RGBA layer with a single foreach_set."""
+    domain = getattr(rgba_layer, 'domain', 'CORNER')
+    channels = np.empty((4, len(rgba_layer.data)), dtype=np.float32)
+    
+    for index, layer in enumerate(channel_layers):
+        channels[index] = read_color_channel(mesh, layer, domain)
+    
+    rgba_layer.data.foreach_set("color", channels.T.ravel())
+
 class OBJECT_OT_CombineVertexColors(Operator):
     bl_idname = "object.combine_vertex_colors"
     bl_label = "Combine RGBA Vertex Colors"
@@ -154,7 +208,7 @@ class OBJECT_OT_CombineVertexColors(Operator):
         for obj in mesh_objects:
             # Verifica la presenza dei layer necessari
             required_layers = ["vertex_R", "vertex_G", "vertex_B", "vertex_A"]
-            missing_layers = [layer for layer in required_layers if layer not in obj.data.vertex_colors]
+            missing_layers = [layer for layer in required_layers if layer not in obj.data.color_attributes]
             
             if missing_layers:
                 self.report({'WARNING'}, 
@@ -162,25 +216,17 @@ class OBJECT_OT_CombineVertexColors(Operator):
                 continue
             
             # Crea o ottiene il layer RGBA
-            if "vertex_RGBA" not in obj.data.vertex_colors:
-                rgba_layer = obj.data.vertex_colors.new(name="vertex_RGBA")
-            else:
-                rgba_layer = obj.data.vertex_colors["vertex_RGBA"]
+            rgba_layer = ensure_color_attribute(obj.data, "vertex_RGBA", context.scene.vertex_color_domain)
             
             # Ottiene i riferimenti ai layer esistenti
-            r_layer = obj.data.vertex_colors["vertex_R"]
-            g_layer = obj.data.vertex_colors["vertex_G"]
-            b_layer = obj.data.vertex_colors["vertex_B"]
-            a_layer = obj.data.vertex_colors["vertex_A"]
-            
-            # Combina i colori
-            for poly in obj.data.polygons:
-                for loop_index in poly.loop_indices:
-                    r = r_layer.data[loop_index].color[0]
-                    g = g_layer.data[loop_index].color[0]
-                    b = b_layer.data[loop_index].color[0]
-                    a = a_layer.data[loop_index].color[0]
-                    rgba_layer.data[loop_index].color = (r, g, b, a)
+            r_layer = obj.data.color_attributes["vertex_R"]
+            g_layer = obj.data.color_attributes["vertex_G"]
+            b_layer = obj.data.color_attributes["vertex_B"]
+            a_layer = obj.data.color_attributes["vertex_A"]
+            
+            # Combina i colori, convertendo il dominio dei canali se diverso da quello di RGBA
+            combine_vertex_color_channels(obj.data, rgba_layer, (r_layer, g_layer, b_layer, a_layer))
+            obj.data.update()
             
             # Imposta il layer RGBA come quello di rendering
             bpy.context.view_layer.objects.active = obj
@@ -202,7 +248,155 @@ def get_edge_lengths_uv(face, uv_layer):
     
     return [(uvs[i] - uvs[(i + 1) % len(uvs)]).length for i in range(len(uvs))]
 
-def analyze_uv_stretch(threshold=0.1):
+def uv_stretch_deviation(mesh, uv_layer, buffers=None, uv=None):
+    """Per-face max deviation of the UV/3D edge length ratio from the face average, computed on all loops at once."""
+    if buffers is None:
+        buffers = read_mesh_buffers(mesh)
+    if uv is None:
+        uv = read_uv_buffer(mesh, uv_layer)
+    
+    co = buffers['co']
+    loop_vert = buffers['loop_vert']
+    loop_next = buffers['loop_next']
+    loop_face = buffers['loop_face']
+    uv = uv.astype(np.float64)
+    
+    # Lato di ogni loop: dal suo vertice a quello del loop successivo nella stessa faccia
+    length_3d = np.linalg.norm(co[loop_vert[loop_next]] - co[loop_vert], axis=1)
+    length_uv = np.linalg.norm(uv[loop_next] - uv, axis=1)
+    ratios = length_uv / np.maximum(length_3d, 1e-6)
+    
+    face_count = len(buffers['loop_total'])
+    avg_stretch = np.bincount(loop_face, weights=ratios, minlength=face_count) / np.maximum(buffers['loop_total'], 1)
+    
+    deviation = np.zeros(face_count)
+    np.maximum.at(deviation, loop_face, np.abs(ratios - avg_stretch[loop_face]))
+    return deviation
+
+UV_STRETCH_METRICS = [
+    ('EDGE_RATIO', "Edge Ratio", "Deviazione del rapporto UV/3D dei lati rispetto alla media della faccia"),
+    ('AREA', "Area", "Rapporto area UV/3D della faccia rispetto a quello dell'intera mesh (|log|)"),
+    ('ANGLE', "Angle", "Massima differenza degli angoli interni tra UV e 3D (radianti)"),
+    ('CONFORMAL', "Conformal", "Rapporto tra valore singolare massimo e minimo dello Jacobiano UV meno 1"),
+]
+
+def corner_angles(a, b, c):
+    """Interior angles at the three corners of each triangle."""
+    def angle(origin, p, q):
+        u = p - origin
+        v = q - origin
+        norm = np.linalg.norm(u, axis=1) * np.linalg.norm(v, axis=1)
+        cos = np.einsum('ij,ij->i', u, v) / np.maximum(norm, 1e-12)
+        return np.arccos(np.clip(cos, -1.0, 1.0))
+    return np.stack((angle(a, b, c), angle(b, c, a), angle(c, a, b)), axis=1)
+
+def uv_distortion(mesh, uv_layer, metric='EDGE_RATIO', per_island=False):
+    """Per-face UV distortion for the given metric and the 3D face areas used as weights."""
+    entry = uv_island_cache.get(mesh, uv_layer)
+    buffers = entry['buffers']
+    uv = entry['uv'].astype(np.float64)
+    co = buffers['co']
+    loop_vert = buffers['loop_vert']
+    loop_next = buffers['loop_next']
+    loop_face = buffers['loop_face']
+    face_count = len(buffers['loop_total'])
+    
+    # Triangolazione a ventaglio di ogni faccia: (primo loop, loop, loop successivo)
+    first = buffers['loop_start'][loop_face]
+    corner = np.arange(len(loop_face))
+    fan = (corner != first) & (loop_next != first)
+    tri_b = corner[fan]
+    tri_c = loop_next[tri_b]
+    tri_a = first[tri_b]
+    tri_face = loop_face[tri_b]
+    
+    p_a, p_b, p_c = co[loop_vert[tri_a]], co[loop_vert[tri_b]], co[loop_vert[tri_c]]
+    q_a, q_b, q_c = uv[tri_a], uv[tri_b], uv[tri_c]
+    
+    area_3d = 0.5 * np.linalg.norm(np.cross(p_b - p_a, p_c - p_a), axis=1)
+    e1, e2 = q_b - q_a, q_c - q_a
+    area_uv = 0.5 * np.abs(e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0])
+    face_area = np.bincount(tri_face, weights=area_3d, minlength=face_count)
+    
+    if metric == 'EDGE_RATIO':
+        values = uv_stretch_deviation(mesh, uv_layer, buffers, entry['uv'])
+    elif metric == 'AREA':
+        face_uv_area = np.bincount(tri_face, weights=area_uv, minlength=face_count)
+        global_ratio = face_uv_area.sum() / max(face_area.sum(), 1e-12)
+        ratio = face_uv_area / np.maximum(face_area, 1e-12) / max(global_ratio, 1e-12)
+        values = np.abs(np.log(np.clip(ratio, 1e-6, 1e6)))
+    else:
+        if metric == 'ANGLE':
+            tri_values = np.abs(corner_angles(q_a, q_b, q_c) - corner_angles(p_a, p_b, p_c)).max(axis=1)
+        else:
+            # Jacobiano UV rispetto a una base ortonormale nel piano del triangolo
+            d1, d2 = p_b - p_a, p_c - p_a
+            len_d1 = np.maximum(np.linalg.norm(d1, axis=1), 1e-12)
+            x_axis = d1 / len_d1[:, None]
+            y_axis = np.cross(np.cross(d1, d2), d1)
+            y_axis /= np.maximum(np.linalg.norm(y_axis, axis=1), 1e-12)[:, None]
+            p12 = np.einsum('ij,ij->i', d2, x_axis)
+            p22 = np.maximum(np.einsum('ij,ij->i', d2, y_axis), 1e-12)
+            
+            jacobian = np.empty((len(tri_face), 2, 2))
+            jacobian[:, :, 0] = e1 / len_d1[:, None]
+            jacobian[:, :, 1] = (e2 - jacobian[:, :, 0] * p12[:, None]) / p22[:, None]
+            sigma = np.linalg.svd(jacobian, compute_uv=False)
+            tri_values = np.minimum(sigma[:, 0] / np.maximum(sigma[:, 1], 1e-12) - 1.0, 1e3)
+        
+        # Media pesata sull'area: i triangoli piccoli contano poco
+        weighted = np.bincount(tri_face, weights=tri_values * area_3d, minlength=face_count)
+        values = np.divide(weighted, face_area, out=np.zeros(face_count), where=face_area > 0)
+    
+    if per_island:
+        island_area = np.bincount(entry['face_islands'], weights=face_area, minlength=entry['island_count'])
+        island_sum = np.bincount(entry['face_islands'], weights=values * face_area, minlength=entry['island_count'])
+        island_values = np.divide(island_sum, island_area, out=np.zeros_like(island_sum), where=island_area > 0)
+        values = island_values[entry['face_islands']]
+    
+    return values, face_area
+
+def stretch_histogram_edges(threshold):
+    """Bucket edges of the distortion histogram, shared by the info bar summary and the report."""
+    return np.array([0.0, threshold * 0.5, threshold, threshold * 2, threshold * 4, np.inf])
+
+def stretch_histogram(values, threshold):
+    """Short text summary of the distortion distribution, bucketed around the threshold."""
+    edges = stretch_histogram_edges(threshold)
+    counts, _ = np.histogram(values, bins=edges)
+    labels = [f"<{edges[1]:.3g}", f"<{edges[2]:.3g}", f"<{edges[3]:.3g}", f"<{edges[4]:.3g}", f">={edges[4]:.3g}"]
+    return " | ".join(f"{label}: {count}" for label, count in zip(labels, counts))
+
+def uv_stretch_report(objects, threshold=0.1, metric='EDGE_RATIO', per_island=False):
+    """Stretch statistics per object, without touching mode or selection."""
+    report = {}
+    
+    for obj in objects:
+        # Sincronizza i dati degli oggetti in Edit Mode senza uscirne
+        if obj.mode == 'EDIT':
+            obj.update_from_editmode()
+        
+        uv_layer = obj.data.uv_layers.active
+        if not uv_layer or not len(obj.data.polygons):
+            continue
+        
+        values, face_area = uv_distortion(obj.data, uv_layer, metric, per_island)
+        counts, _ = np.histogram(values, bins=stretch_histogram_edges(threshold))
+        total_area = face_area.sum()
+        
+        report[obj.name] = {
+            'metric': metric,
+            'threshold': threshold,
+            'faces': len(values),
+            'stretched_faces': int(np.count_nonzero(values > threshold)),
+            'max': float(values.max()),
+            'mean': float((values * face_area).sum() / total_area) if total_area > 0 else 0.0,
+            'histogram': [int(count) for count in counts],
+        }
+    
+    return report
+
+def analyze_uv_stretch(threshold=0.1, use_batch=True, metric='EDGE_RATIO', per_island=False):
     # Salva la modalità corrente
     original_mode = bpy.context.object.mode if bpy.context.object else 'OBJECT'
     
@@ -214,12 +408,13 @@ def analyze_uv_stretch(threshold=0.1):
     
     if not selected_objects:
         print("Nessun oggetto mesh selezionato!")
-        return
+        return None
+    
+    all_values = []
     
     # Deseleziona tutte le facce in tutti gli oggetti
     for obj in selected_objects:
-        for polygon in obj.data.polygons:
-            polygon.select = False
+        obj.data.polygons.foreach_set("select", np.zeros(len(obj.data.polygons), dtype=bool))
     
     for obj in selected_objects:
         print(f"\nAnalisi UV stretch per l'oggetto: {obj.name}")
@@ -227,6 +422,20 @@ def analyze_uv_stretch(threshold=0.1):
         # Rendi l'oggetto corrente attivo
         bpy.context.view_layer.objects.active = obj
         
+        if use_batch or metric != 'EDGE_RATIO':
+            uv_layer = obj.data.uv_layers.active
+            if not uv_layer:
+                print(f"L'oggetto {obj.name} non ha UV maps!")
+                continue
+            
+            values, _ = uv_distortion(obj.data, uv_layer, metric, per_island)
+            all_values.append(values)
+            stretched = values > threshold
+            obj.data.polygons.foreach_set("select", stretched)
+            obj.data.update()
+            print(f"Facce con stretch: {int(stretched.sum())}")
+            continue
+        
         bm = bmesh.new()
         bm.from_mesh(obj.data)
         bm.faces.ensure_lookup_table()
@@ -237,7 +446,7 @@ def analyze_uv_stretch(threshold=0.1):
             bm.free()
             continue
         
-        stretched_faces = []
+        stretched_faces = set()
         for face in bm.faces:
             edge_lengths_3d = get_edge_lengths_3d(face)
             edge_lengths_uv = get_edge_lengths_uv(face, uv_layer)
@@ -250,19 +459,20 @@ def analyze_uv_stretch(threshold=0.1):
             deviation = max(abs(r - avg_stretch) for r in stretch_ratios)
             
             if deviation > threshold:
-                stretched_faces.append(face)
-        
-        for face in bm.faces:
-            face.select = face in stretched_faces
+                stretched_faces.add(face.index)
         
-        bm.to_mesh(obj.data)
         bm.free()
         
+        select = np.zeros(len(obj.data.polygons), dtype=bool)
+        select[list(stretched_faces)] = True
+        obj.data.polygons.foreach_set("select", select)
         obj.data.update()
     
     # Passa in Edit Mode alla fine dell'analisi
     bpy.ops.object.mode_set(mode='EDIT')
     bpy.ops.mesh.select_mode(type='FACE')
+    
+    return np.concatenate(all_values) if all_values else None
 
 class UV_OT_AnalyzeStretch(bpy.types.Operator):
     bl_idname = "uv.analyze_stretch"
@@ -277,8 +487,80 @@ class UV_OT_AnalyzeStretch(bpy.types.Operator):
         max=1.0
     )
     
+    use_batch: bpy.props.BoolProperty(
+        name="Batch",
+        description="Calcola lo stretch di tutte le facce in un unico passaggio vettoriale",
+        default=True
+    )
+    
+    metric: bpy.props.EnumProperty(
+        name="Metric",
+        description="Misura di distorsione usata per la soglia",
+        items=UV_STRETCH_METRICS,
+        default='EDGE_RATIO'
+    )
+    
+    per_island: bpy.props.BoolProperty(
+        name="Per Island",
+        description="Media pesata sull'area per isola UV: seleziona le isole intere oltre la soglia",
+        default=False
+    )
+    
+    report_only: bpy.props.BoolProperty(
+        name="Report Only",
+        description="Scrive solo le statistiche, senza cambiare modalità o selezione",
+        default=False
+    )
+    
+    report_target: bpy.props.EnumProperty(
+        name="Report Target",
+        items=[
+            ('PROPERTY', "Custom Property", "Salva il report nella proprietà 'uv_stretch_report' di ogni oggetto"),
+            ('JSON', "JSON File", "Salva il report di tutti gli oggetti in un file JSON"),
+        ],
+        default='PROPERTY'
+    )
+    
+    report_path: bpy.props.StringProperty(
+        name="Report Path",
+        description="File JSON di destinazione (vuoto: accanto al file .blend)",
+        default="",
+        subtype='FILE_PATH'
+    )
+    
+    def execute_report(self, context):
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        report = uv_stretch_report(objects, self.threshold, self.metric, self.per_island)
+        if not report:
+            self.report({'WARNING'}, "No selected mesh with UV maps")
+            return {'CANCELLED'}
+        
+        if self.report_target == 'PROPERTY':
+            for obj in objects:
+                if obj.name in report:
+                    obj["uv_stretch_report"] = report[obj.name]
+            self.report({'INFO'}, f"UV stretch report stored on {len(report)} objects")
+            return {'FINISHED'}
+        
+        path = bpy.path.abspath(self.report_path) if self.report_path else ""
+        if not path:
+            if not bpy.data.filepath:
+                self.report({'WARNING'}, "Save the .blend file or set a report path")
+                return {'CANCELLED'}
+            path = os.path.splitext(bpy.data.filepath)[0] + "_uv_stretch.json"
+        
+        with open(path, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+        self.report({'INFO'}, f"UV stretch report for {len(report)} objects written to {path}")
+        return {'FINISHED'}
+    
     def execute(self, context):
-        analyze_uv_stretch(self.threshold)
+        if self.report_only:
+            return self.execute_report(context)
+        
+        values = analyze_uv_stretch(self.threshold, self.use_batch, self.metric, self.per_island)
+        if values is not None and len(values):
+            self.report({'INFO'}, f"UV stretch {self.metric.lower()} (max {values.max():.3g}): {stretch_histogram(values, self.threshold)}")
         return {'FINISHED'}
 
 class ToggleFaceOrientation(bpy.types.Operator):
@@ -320,6 +602,217 @@ class ToggleBackfaceCullingOperator(bpy.types.Operator):
         self.report({'ERROR'}, "No 3D View found")
         return {'CANCELLED'}
     
+def read_mesh_buffers(mesh):
+    """Read vertex positions and polygon topology of a mesh into NumPy arrays."""
+    vertex_count = len(mesh.vertices)
+    loop_count = len(mesh.loops)
+    face_count = len(mesh.polygons)
+
+    co = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+
+    loop_vert = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vert)
+
+    loop_start = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+
+    loop_total = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+
+    # Face owning each loop and the loop that follows it inside the same face
+    loop_face = np.repeat(np.arange(face_count), loop_total)
+    loop_next = np.arange(1, loop_count + 1)
+    loop_next[loop_start + loop_total - 1] = loop_start
+
+    return {
+        'co': co.reshape(-1, 3).astype(np.float64),
+        'loop_vert': loop_vert,
+        'loop_start': loop_start,
+        'loop_total': loop_total,
+        'loop_face': loop_face,
+        'loop_next': loop_next,
+    }
+
+def union_find_labels(count, pairs_a, pairs_b):
+    """Group count elements linked by the (a, b) pairs and return a compact group label for each one."""
+    parent = list(range(count))
+
+    for a, b in zip(pairs_a.tolist(), pairs_b.tolist()):
+        # Find both roots with path halving
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+
+    roots = np.array(parent, dtype=np.int64)
+    # Parents always point to a lower index, so one ordered pass resolves every root
+    for i in range(count):
+        roots[i] = roots[roots[i]]
+
+    return np.unique(roots, return_inverse=True)[1].ravel()
+
+def build_uv_islands(mesh, uv_layer=None, threshold=0.0001, buffers=None):
+    """Return the UV island index of every face and the number of islands.
+
+    Two faces belong to the same island when they share a mesh edge whose two
+    UV coordinates match after quantization to the threshold.
+    """
+    uv_layer = uv_layer or mesh.uv_layers.active
+    data = buffers or read_mesh_buffers(mesh)
+    loop_vert = data['loop_vert']
+    loop_next = data['loop_next']
+    loop_face = data['loop_face']
+    face_count = len(data['loop_start'])
+
+    if face_count == 0:
+        return np.zeros(0, dtype=np.int64), 0
+
+    uv = np.empty(len(loop_vert) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uv)
+    uv_keys = np.round(uv.reshape(-1, 2) / threshold).astype(np.int64)
+
+    # Key every loop edge by its vertices and UVs, ordered from the lower vertex
+    # index so that the two faces around a shared edge produce the same key
+    vert1, vert2 = loop_vert, loop_vert[loop_next]
+    uv1, uv2 = uv_keys, uv_keys[loop_next]
+    swap = vert1 > vert2
+    keys = np.column_stack((
+        np.where(swap, vert2, vert1),
+        np.where(swap, vert1, vert2),
+        np.where(swap[:, None], uv2, uv1),
+        np.where(swap[:, None], uv1, uv2),
+    ))
+    edge_ids = np.unique(keys, axis=0, return_inverse=True)[1].ravel()
+
+    # Loops with the same edge key connect their faces
+    order = np.argsort(edge_ids, kind='stable')
+    shared = edge_ids[order[1:]] == edge_ids[order[:-1]]
+    faces_a = loop_face[order[:-1][shared]]
+    faces_b = loop_face[order[1:][shared]]
+
+    face_islands = union_find_labels(face_count, faces_a, faces_b)
+    return face_islands, int(face_islands.max()) + 1
+
+def read_uv_buffer(mesh, uv_layer):
+    """Read the UV coordinates of every loop into an (n, 2) array."""
+    uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uv)
+    return uv.reshape(-1, 2)
+
+def uv_signed_areas(uv, buffers):
+    """Signed UV area of each face with the shoelace formula over all of its loops."""
+    uv_next = uv[buffers['loop_next']]
+    cross_uv = uv[:, 0] * uv_next[:, 1] - uv_next[:, 0] * uv[:, 1]
+    return np.bincount(buffers['loop_face'], weights=cross_uv, minlength=len(buffers['loop_start'])) * 0.5
+
+def mesh_content_hash(*buffers):
+    """Cheap checksum of NumPy buffers, used to detect geometry or UV changes."""
+    checksum = 0
+    for buffer in buffers:
+        checksum = zlib.crc32(np.ascontiguousarray(buffer), checksum)
+    return checksum
+
+class UVIslandCache:
+    """LRU cache of UV islands and per-face areas for each mesh datablock and UV layer.
+
+    Entries are validated against a checksum of the vertex, topology and UV
+    buffers, so an edited mesh is rebuilt while an unchanged one is reused.
+    """
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.used_bytes = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.used_bytes = 0
+
+    def get(self, mesh, uv_layer=None, build=True):
+        """Return the cached entry for a mesh, rebuilding it if the mesh changed.
+
+        With build=False a missing or stale entry is not rebuilt and None is returned.
+        """
+        uv_layer = uv_layer or mesh.uv_layers.active
+        if not uv_layer:
+            return None
+
+        buffers = read_mesh_buffers(mesh)
+        uv = read_uv_buffer(mesh, uv_layer)
+        content_hash = mesh_content_hash(buffers['co'], buffers['loop_vert'], buffers['loop_total'], uv)
+        key = (mesh.session_uid, uv_layer.name)
+
+        entry = self.entries.get(key)
+        if entry and entry['hash'] == content_hash:
+            self.entries.move_to_end(key)
+            return entry
+
+        if entry:
+            self.discard(key)
+
+        if not build:
+            return None
+
+        entry = self.build_entry(mesh, uv_layer, buffers, uv)
+        entry['hash'] = content_hash
+        self.entries[key] = entry
+        self.used_bytes += entry['nbytes']
+
+        # Evict the least recently used meshes, but always keep the current one
+        while self.used_bytes > self.max_bytes and len(self.entries) > 1:
+            self.discard(next(iter(self.entries)))
+
+        return entry
+
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry:
+            self.used_bytes -= entry['nbytes']
+
+    @staticmethod
+    def build_entry(mesh, uv_layer, buffers, uv):
+        loop_face = buffers['loop_face']
+        loop_next = buffers['loop_next']
+        face_count = len(buffers['loop_start'])
+
+        face_islands, island_count = build_uv_islands(mesh, uv_layer, buffers=buffers)
+
+        uv_area = uv_signed_areas(uv, buffers)
+
+        # Vector area of each face in local space, its length is the face area
+        # and it maps to world space through the cofactor of matrix_world
+        positions = buffers['co'][buffers['loop_vert']]
+        cross_3d = np.cross(positions, positions[loop_next])
+        area_vectors = np.stack([np.bincount(loop_face, weights=cross_3d[:, axis], minlength=face_count)
+                                 for axis in range(3)], axis=1) * 0.5
+
+        entry = {
+            'buffers': buffers,
+            'uv': uv,
+            'face_islands': face_islands,
+            'island_count': island_count,
+            'uv_area': uv_area,
+            'area_vectors': area_vectors,
+        }
+        arrays = list(buffers.values()) + [uv, face_islands, uv_area, area_vectors]
+        entry['nbytes'] = sum(array.nbytes for array in arrays)
+        return entry
+
+uv_island_cache = UVIslandCache()
+
+def world_face_areas(area_vectors, matrix_world):
+    """Face areas in world space from cached local vector areas."""
+    matrix = np.array(matrix_world, dtype=np.float64)[:3, :3]
+    determinant = np.linalg.det(matrix)
+    if determinant == 0:
+        return np.zeros(len(area_vectors))
+    cofactor = determinant * np.linalg.inv(matrix).T
+    return np.linalg.norm(area_vectors @ cofactor.T, axis=1)
+
 class ZFightDetector(bpy.types.Operator):
     bl_idname = "object.zfight_detector"
     bl_label = "Check Z-Fight"
@@ -329,6 +822,29 @@ class ZFightDetector(bpy.types.Operator):
     threshold = 0.0001
     distance_threshold = 0.1
 
+    engine: EnumProperty(
+        name="Engine",
+        description="Method used to find the candidate face pairs",
+        items=[
+            ('BRUTE_FORCE', "Brute Force", "Compare every face with every face of the other objects"),
+            ('GRID', "Spatial Hash", "Compare only faces whose centers share a neighbouring grid cell"),
+            ('BVH', "BVH Tree", "Query a world-space BVH tree of each object around every face center"),
+        ],
+        default='GRID'
+    )
+
+    self_overlap: BoolProperty(
+        name="Self Overlap",
+        description="Also detect coplanar overlapping faces inside the same object, such as duplicated shells after a join",
+        default=False
+    )
+
+    exact_overlap: BoolProperty(
+        name="Exact Overlap",
+        description="Confirm the pairs that pass the bounding box test with a separating axis test on the actual polygons",
+        default=True
+    )
+
     def execute(self, context):
         if context.active_object and context.active_object.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
@@ -341,17 +857,23 @@ class ZFightDetector(bpy.types.Operator):
             bpy.ops.mesh.select_all(action='DESELECT')
             bpy.ops.object.mode_set(mode='OBJECT')
         
-        problematic_faces, zfight_count = self.detect_zfights(selected_objects)
+        start_time = time.perf_counter()
+        problematic_faces, zfight_count, pruned_pairs, broad_hits, exact_hits = self.detect_zfights(selected_objects)
+        elapsed = time.perf_counter() - start_time
 
         for obj, faces in problematic_faces.items():
-            for face in faces:
-                face.select = True
+            if faces:
+                selection = np.zeros(len(obj.data.polygons), dtype=bool)
+                selection[list(faces)] = True
+                obj.data.polygons.foreach_set("select", selection)
 
         if selected_objects:
             context.view_layer.objects.active = selected_objects[0]
             bpy.ops.object.mode_set(mode='EDIT')
         
         print(f"Total number of faces with z-fighting: {zfight_count}")
+        self.report({'INFO'}, f"Z-Fight faces: {zfight_count} - Pruned candidate pairs: {pruned_pairs} - "
+                              f"Broad-phase hits: {broad_hits} - Exact hits: {exact_hits} - {self.engine}: {elapsed:.2f}s")
         return {'FINISHED'}
 
     @staticmethod
@@ -362,30 +884,55 @@ class ZFightDetector(bpy.types.Operator):
         return [matrix_world @ mesh_vertices[i].co for i in face.vertices]
 
     @staticmethod
-    def get_face_props(vertices):
+    def get_face_props(obj):
+        """Compute world-space centers, normals and areas of all faces in one batch"""
+        data = read_mesh_buffers(obj.data)
+        loop_vert = data['loop_vert']
+        loop_start = data['loop_start']
+        loop_total = data['loop_total']
+        loop_face = data['loop_face']
+        face_count = len(loop_start)
+
+        matrix_world = np.array(obj.matrix_world, dtype=np.float64)
+        world_co = data['co'] @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+        positions = world_co[loop_vert]
+
         # Compute the center as the average of the vertices
-        num_vertices = len(vertices)
-        center = sum(vertices, mathutils.Vector()) / num_vertices
-        
+        centers = np.stack([np.bincount(loop_face, weights=positions[:, axis], minlength=face_count)
+                            for axis in range(3)], axis=1) / loop_total[:, None]
+
         # Compute the normal using the first three vertices
-        v1, v2, v3 = vertices[:3]
-        edge1 = v2 - v1
-        edge2 = v3 - v1
-        normal = edge1.cross(edge2)
-        normal_length = normal.length
-        
-        if normal_length > 0:
-            normal /= normal_length  # Normalize only if the length is not zero
-        
-        # Compute the area using the cross product method
-        area = 0
-        for i in range(1, num_vertices - 1):
-            edge1 = vertices[i] - vertices[0]
-            edge2 = vertices[i + 1] - vertices[0]
-            area += edge1.cross(edge2).length
-        area *= 0.5  # The total area is half of the sum
-        
-        return center, normal, area
+        first = positions[loop_start]
+        normals = np.cross(positions[loop_start + 1] - first, positions[loop_start + 2] - first)
+        normal_lengths = np.linalg.norm(normals, axis=1)
+        nonzero = normal_lengths > 0
+        normals[nonzero] /= normal_lengths[nonzero, None]  # Normalize only if the length is not zero
+
+        # Compute the area as a fan of triangles around the first vertex
+        corner = np.arange(len(loop_vert)) - loop_start[loop_face]
+        fan = np.nonzero((corner >= 1) & (corner <= loop_total[loop_face] - 2))[0]
+        fan_origin = positions[loop_start[loop_face[fan]]]
+        triangle_areas = np.linalg.norm(np.cross(positions[fan] - fan_origin, positions[fan + 1] - fan_origin), axis=1)
+        areas = np.bincount(loop_face[fan], weights=triangle_areas, minlength=face_count) * 0.5
+
+        return {
+            'world_co': world_co,
+            'loop_vert': loop_vert,
+            'loop_start': loop_start,
+            'loop_total': loop_total,
+            'centers': centers,
+            'normals': normals,
+            'areas': areas,
+            # Vectors for the per-pair tests, which are faster on mathutils than on small arrays
+            'center_vectors': [Vector(center) for center in centers.tolist()],
+            'normal_vectors': [Vector(normal) for normal in normals.tolist()],
+        }
+
+    @staticmethod
+    def get_face_verts(face_props, face_index):
+        """Return the world-space vertices of a face as an (n, 3) array"""
+        start = face_props['loop_start'][face_index]
+        return face_props['world_co'][face_props['loop_vert'][start:start + face_props['loop_total'][face_index]]]
 
     def check_face_overlap(self, verts1, verts2, normal1, normal2):
         # First, check the alignment of the normals
@@ -399,72 +946,256 @@ class ZFightDetector(bpy.types.Operator):
         
         # Project the vertices onto the appropriate plane
         if normal_components[2] == max_component:  # z is dominant
-            verts1_2d = [(v.x, v.y) for v in verts1]
-            verts2_2d = [(v.x, v.y) for v in verts2]
+            axes = [0, 1]
         else:  # x or y are dominants
-            verts1_2d = [(v.y, v.z) for v in verts1]
-            verts2_2d = [(v.y, v.z) for v in verts2]
+            axes = [1, 2]
 
-        # Calculate the 2D bounding boxes using list comprehension
-        x_coords1, y_coords1 = zip(*verts1_2d)
-        x_coords2, y_coords2 = zip(*verts2_2d)
+        # Calculate the 2D bounding boxes
+        min1, max1 = verts1[:, axes].min(axis=0), verts1[:, axes].max(axis=0)
+        min2, max2 = verts2[:, axes].min(axis=0), verts2[:, axes].max(axis=0)
         
         # Check overlap using min/max
-        return not (max(x_coords1) < min(x_coords2) or 
-                   min(x_coords1) > max(x_coords2) or 
-                   max(y_coords1) < min(y_coords2) or 
-                   min(y_coords1) > max(y_coords2))
+        return not (max1[0] < min2[0] or 
+                   min1[0] > max2[0] or 
+                   max1[1] < min2[1] or 
+                   min1[1] > max2[1])
+
+    def check_polygon_overlap(self, verts1, verts2, normal1):
+        """Separating axis test between two faces projected on their dominant-axis plane"""
+        # Drop the coordinate along which the normal is dominant: x -> YZ, y -> XZ, z -> XY
+        dominant_axis = max(range(3), key=lambda axis: abs(normal1[axis]))
+        axes = [axis for axis in range(3) if axis != dominant_axis]
+        poly1 = verts1[:, axes]
+        poly2 = verts2[:, axes]
+
+        # Candidate separating axes are the edge normals of both polygons
+        edges = np.concatenate((np.roll(poly1, -1, axis=0) - poly1, np.roll(poly2, -1, axis=0) - poly2))
+        edge_normals = np.stack((-edges[:, 1], edges[:, 0]), axis=1)
+        lengths = np.linalg.norm(edge_normals, axis=1)
+        edge_normals = edge_normals[lengths > 0] / lengths[lengths > 0, None]
+
+        projection1 = poly1 @ edge_normals.T
+        projection2 = poly2 @ edge_normals.T
+
+        # Faces that only touch along an edge are not z-fighting, so the
+        # projections must overlap by more than the threshold on every axis
+        separated = ((projection1.max(axis=0) <= projection2.min(axis=0) + self.threshold) |
+                     (projection2.max(axis=0) <= projection1.min(axis=0) + self.threshold))
+        return not separated.any()
+
+    def brute_force_pairs(self, selected_objects, object_face_props):
+        """Yield every cross-object face pair"""
+        for obj_index1, obj1 in enumerate(selected_objects):
+            if self.self_overlap:
+                face_count = len(object_face_props[obj1]['loop_start'])
+                for face_index1 in range(face_count):
+                    for face_index2 in range(face_index1 + 1, face_count):
+                        yield obj_index1, face_index1, obj_index1, face_index2
+
+            for obj_index2 in range(obj_index1 + 1, len(selected_objects)):
+                obj2 = selected_objects[obj_index2]
+                for face_index1 in range(len(object_face_props[obj1]['loop_start'])):
+                    for face_index2 in range(len(object_face_props[obj2]['loop_start'])):
+                        yield obj_index1, face_index1, obj_index2, face_index2
+
+    def bvh_pairs(self, selected_objects, object_face_props):
+        """Yield cross-object face pairs found by BVH range queries around face centers"""
+        # BVHTree.overlap only reports intersecting triangles and skips coplanar
+        # ones, so every face center is queried with find_nearest_range instead.
+        # A face whose center is within the distance threshold is always inside
+        # the range, so no pair accepted by the brute-force loop is lost
+        trees = []
+        bounds = []
+        for obj in selected_objects:
+            face_props = object_face_props[obj]
+            vertices = face_props['world_co'].tolist()
+            polygons = [face.tolist() for face in np.split(face_props['loop_vert'], face_props['loop_start'][1:])]
+            trees.append(BVHTree.FromPolygons(vertices, polygons))
+            # World bounding box grown by the threshold: a face center outside it
+            # cannot have any face of this object within range
+            if len(face_props['world_co']):
+                bounds.append((face_props['world_co'].min(axis=0) - self.distance_threshold,
+                               face_props['world_co'].max(axis=0) + self.distance_threshold))
+            else:
+                bounds.append(None)
+
+        first_target = 0 if self.self_overlap else 1
+
+        for obj_index1, obj1 in enumerate(selected_objects):
+            centers = object_face_props[obj1]['centers']
+            center_vectors = object_face_props[obj1]['center_vectors']
+            for obj_index2 in range(obj_index1 + first_target, len(selected_objects)):
+                if bounds[obj_index2] is None or not len(centers):
+                    continue
+
+                # Only centers inside the other object's grown box are queried, so
+                # object pairs that are far apart cost a single vectorized test
+                low, high = bounds[obj_index2]
+                inside = np.all((centers >= low) & (centers <= high), axis=1)
+                for face_index1 in np.flatnonzero(inside).tolist():
+                    # FromPolygons triangulates quads and n-gons, so one polygon can be hit once per triangle
+                    hits = {hit[2] for hit in trees[obj_index2].find_nearest_range(center_vectors[face_index1], self.distance_threshold)}
+                    for face_index2 in sorted(hits):
+                        # Inside the same object report each pair once
+                        if obj_index2 == obj_index1 and face_index2 <= face_index1:
+                            continue
+                        yield obj_index1, face_index1, obj_index2, face_index2
+
+    def spatial_hash_pairs(self, selected_objects, object_face_props):
+        """Yield cross-object face pairs whose centers fall in neighbouring grid cells"""
+        # With the cell size equal to the distance threshold, two centers closer
+        # than the threshold are always in the same or in an adjacent cell
+        cell_size = self.distance_threshold
+        grid = defaultdict(list)
+
+        for obj_index, obj in enumerate(selected_objects):
+            cells = np.floor(object_face_props[obj]['centers'] / cell_size).astype(np.int64)
+            for face_index, cell in enumerate(map(tuple, cells.tolist())):
+                grid[cell].append((obj_index, face_index))
+
+        offsets = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+
+        for (cx, cy, cz), entries in grid.items():
+            neighbours = []
+            for dx, dy, dz in offsets:
+                neighbours.extend(grid.get((cx + dx, cy + dy, cz + dz), ()))
+
+            for obj_index1, face_index1 in entries:
+                for obj_index2, face_index2 in neighbours:
+                    # Compare each pair of objects only once, as the brute-force loop does
+                    if obj_index2 > obj_index1:
+                        yield obj_index1, face_index1, obj_index2, face_index2
+                    elif self.self_overlap and obj_index2 == obj_index1 and face_index2 > face_index1:
+                        yield obj_index1, face_index1, obj_index2, face_index2
 
     def detect_zfights(self, selected_objects):
         problematic_faces = {obj: set() for obj in selected_objects}
         zfight_count = 0
 
         # Precompute the face properties for all objects
-        object_face_props = {}
-        for obj in selected_objects:
-            face_props = []
-            matrix_world = obj.matrix_world  # Cache matrix
-            mesh_vertices = obj.data.vertices  # Cache vertices
-            
-            for face in obj.data.polygons:
-                verts = [matrix_world @ mesh_vertices[i].co for i in face.vertices]
-                props = self.get_face_props(verts)
-                face_props.append((face, verts, *props))
-            object_face_props[obj] = face_props
-
-        # Compare the faces between the objects
-        for i, obj1 in enumerate(selected_objects):
-            faces1_props = object_face_props[obj1]
-
-            for obj2 in selected_objects[i + 1:]:
-                faces2_props = object_face_props[obj2]
-
-                for face1, verts1, center1, normal1, area1 in faces1_props:
-                    for face2, verts2, center2, normal2, area2 in faces2_props:
-                        # First, check the distance between the centers
-                        if (center1 - center2).length > self.distance_threshold:
-                            continue
+        object_face_props = {obj: self.get_face_props(obj) for obj in selected_objects}
+
+        # Number of pairs the brute-force comparison would test
+        face_counts = [len(object_face_props[obj]['loop_start']) for obj in selected_objects]
+        total_pairs = sum(count * sum(face_counts[i + 1:]) for i, count in enumerate(face_counts))
+        if self.self_overlap:
+            total_pairs += sum(count * (count - 1) // 2 for count in face_counts)
+        candidate_pairs = 0
+        broad_hits = 0
+        exact_hits = 0
+
+        if self.engine == 'BVH':
+            pairs = self.bvh_pairs(selected_objects, object_face_props)
+        elif self.engine == 'GRID':
+            pairs = self.spatial_hash_pairs(selected_objects, object_face_props)
+        else:
+            pairs = self.brute_force_pairs(selected_objects, object_face_props)
+
+        # Refine the candidate pairs with the normal and plane-distance tests
+        for obj_index1, face_index1, obj_index2, face_index2 in pairs:
+            candidate_pairs += 1
+            obj1 = selected_objects[obj_index1]
+            obj2 = selected_objects[obj_index2]
+            props1 = object_face_props[obj1]
+            props2 = object_face_props[obj2]
+            center1 = props1['center_vectors'][face_index1]
+            center2 = props2['center_vectors'][face_index2]
+
+            # First, check the distance between the centers
+            if (center1 - center2).length > self.distance_threshold:
+                continue
 
-                        # Check overlap and the distance along the normal
-                        if self.check_face_overlap(verts1, verts2, normal1, normal2):
-                            dist = abs(normal1.dot(center1 - center2))
-                            if dist < self.threshold:
-                                problematic_faces[obj1].add(face1)
-                                problematic_faces[obj2].add(face2)
-                                zfight_count += 2
+            # Neighbouring faces of the same surface share vertices, duplicated shells do not
+            if obj1 is obj2:
+                start1, start2 = props1['loop_start'][face_index1], props2['loop_start'][face_index2]
+                face_verts1 = props1['loop_vert'][start1:start1 + props1['loop_total'][face_index1]]
+                face_verts2 = props2['loop_vert'][start2:start2 + props2['loop_total'][face_index2]]
+                if np.intersect1d(face_verts1, face_verts2).size:
+                    continue
+
+            verts1 = self.get_face_verts(props1, face_index1)
+            verts2 = self.get_face_verts(props2, face_index2)
+
+            # Check overlap and the distance along the normal
+            normal1 = props1['normal_vectors'][face_index1]
+            normal2 = props2['normal_vectors'][face_index2]
+            if self.check_face_overlap(verts1, verts2, normal1, normal2):
+                dist = abs(normal1.dot(center1 - center2))
+                if dist < self.threshold:
+                    broad_hits += 1
+
+                    # The exact polygon test runs only on pairs that pass the cheap tests
+                    if self.exact_overlap and not self.check_polygon_overlap(verts1, verts2, normal1):
+                        continue
+
+                    exact_hits += 1
+                    problematic_faces[obj1].add(face_index1)
+                    problematic_faces[obj2].add(face_index2)
+                    zfight_count += 2
+
+        return problematic_faces, zfight_count, total_pairs - candidate_pairs, broad_hits, exact_hits
 
-        return problematic_faces, zfight_count
+# Texture size and target density (px/m) shared by the texel density tools
+TEXEL_DENSITY_PRESETS = {
+    'TEX_512': (512, 256),
+    'TEX_1024': (1024, 512),
+    'TEX_2048': (2048, 1024),
+    'TEX_4096': (4096, 2048),
+}
+
+_applying_texel_preset = False
+
+def update_texel_density_preset(self, context):
+    global _applying_texel_preset
+    preset = TEXEL_DENSITY_PRESETS.get(self.texel_density_preset)
+    if preset:
+        # Evita che i callback dei valori riportino il preset a Custom
+        _applying_texel_preset = True
+        try:
+            self.texel_texture_size, self.texel_target_density = preset
+        finally:
+            _applying_texel_preset = False
+
+def update_texel_density_values(self, context):
+    if _applying_texel_preset:
+        return
+    preset = TEXEL_DENSITY_PRESETS.get(self.texel_density_preset)
+    if preset and (self.texel_texture_size, self.texel_target_density) != preset:
+        self.texel_density_preset = 'CUSTOM'
 
 class UVTextureScaleCheckerOperator(Operator):
     bl_idname = "object.uv_texture_scale_checker"
     bl_label = "Check UV Texel Density"
-    bl_description = "Check if UV islands match target texel density (1024) for 2048x2048 texture"
+    bl_description = "Check if UV islands match the target texel density of the active preset"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # Fixed values as class constants
-    TARGET_TEXTURE_SIZE = 2048
-    TARGET_DENSITY = 1024
-    THRESHOLD = 1.0
+    texture_size: IntProperty(
+        name="Texture Size",
+        description="Texture resolution used to compute the texel density",
+        default=2048,
+        min=1
+    )
+
+    target_density: FloatProperty(
+        name="Target Density",
+        description="Expected texel density in pixels per meter",
+        default=1024.0,
+        min=0.001
+    )
+
+    threshold: FloatProperty(
+        name="Tolerance",
+        description="Allowed deviation from the target density in percent",
+        default=1.0,
+        min=0.0,
+        subtype='PERCENTAGE'
+    )
+
+    batch_mode: BoolProperty(
+        name="Batch",
+        description="Compute the density of all selected meshes at once in Object Mode, including object scale",
+        default=True
+    )
 
     def calc_face_uv_area(self, face, uv_layer):
         """Calculate accurate UV area for a face"""
@@ -488,41 +1219,21 @@ class UVTextureScaleCheckerOperator(Operator):
         if uv_area == 0:
             return 0
             
-        texel_density = math.sqrt((uv_area * self.TARGET_TEXTURE_SIZE * self.TARGET_TEXTURE_SIZE) / world_area)
+        texel_density = math.sqrt((uv_area * self.texture_size * self.texture_size) / world_area)
         return texel_density
 
-    def find_connected_faces(self, start_face, uv_layer, threshold=0.0001):
-        """Find UV connected faces with improved precision"""
-        island = {start_face}
-        to_process = {start_face}
-        
-        while to_process:
-            face = to_process.pop()
-            for edge in face.edges:
-                for connected_face in edge.link_faces:
-                    if connected_face not in island:
-                        face_uvs = {tuple(loop[uv_layer].uv) for loop in face.loops}
-                        connected_uvs = {tuple(loop[uv_layer].uv) for loop in connected_face.loops}
-                        
-                        for uv1 in face_uvs:
-                            for uv2 in connected_uvs:
-                                if (abs(uv1[0] - uv2[0]) < threshold and 
-                                    abs(uv1[1] - uv2[1]) < threshold):
-                                    island.add(connected_face)
-                                    to_process.add(connected_face)
-                                    break
-        return island
-
-    def get_uv_islands(self, bm, uv_layer):
-        """Get all UV islands"""
-        islands = []
-        processed = set()
+    def get_uv_islands(self, bm, uv_layer, obj):
+        """Get all UV islands, or None if the cached islands do not match the edit mesh"""
+        # Le modifiche in Edit Mode non ancora scritte nella mesh renderebbero la cache obsoleta
+        obj.update_from_editmode()
+        mesh = obj.data
+        entry = uv_island_cache.get(mesh, mesh.uv_layers[uv_layer.name])
+        if entry is None or len(entry['face_islands']) != len(bm.faces):
+            return None
         
-        for face in bm.faces:
-            if face not in processed:
-                island = self.find_connected_faces(face, uv_layer)
-                islands.append(island)
-                processed.update(island)
+        islands = [[] for _ in range(entry['island_count'])]
+        for face, island in zip(bm.faces, entry['face_islands'].tolist()):
+            islands[island].append(face)
         
         return islands
 
@@ -544,12 +1255,70 @@ class UVTextureScaleCheckerOperator(Operator):
             
         return total_density / total_area
 
+    def calculate_island_densities(self, entry, matrix_world):
+        """Calculate the average density of every island from cached face areas"""
+        world_area = world_face_areas(entry['area_vectors'], matrix_world)
+        uv_area = np.abs(entry['uv_area'])
+        face_islands = entry['face_islands']
+        
+        valid = (world_area > 0) & (uv_area > 0)
+        density = np.zeros(len(world_area))
+        density[valid] = np.sqrt(uv_area[valid] * self.texture_size * self.texture_size / world_area[valid])
+        weights = np.where(valid, world_area, 0.0)
+        
+        total_density = np.zeros(entry['island_count'])
+        total_area = np.zeros(entry['island_count'])
+        np.add.at(total_density, face_islands, density * weights)
+        np.add.at(total_area, face_islands, weights)
+        
+        return np.divide(total_density, total_area, out=np.zeros_like(total_density), where=total_area > 0)
+
+    def execute_batch(self, context, selected_objects):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        for obj in selected_objects:
+            mesh = obj.data
+            entry = uv_island_cache.get(mesh)
+            if entry is None:
+                self.report({'WARNING'}, f"Object {obj.name} has no active UV layer")
+                continue
+
+            densities = self.calculate_island_densities(entry, obj.matrix_world)
+            density_diff = np.abs((densities - self.target_density) / self.target_density) * 100
+            wrong_islands = density_diff > self.threshold
+
+            mesh.polygons.foreach_set("select", wrong_islands[entry['face_islands']])
+            mesh.update()
+
+            if wrong_islands.any():
+                worst = int(np.argmax(density_diff))
+                self.report({'INFO'}, 
+                    f"{obj.name}: {int(wrong_islands.sum())} of {entry['island_count']} islands out of threshold, "
+                    f"worst density: {densities[worst]:.0f}, "
+                    f"Target: {self.target_density:.0f}, "
+                    f"Diff: {density_diff[worst]:.1f}%")
+            else:
+                self.report({'INFO'}, f"All UV islands in {obj.name} are within threshold")
+
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        scene = context.scene
+        self.texture_size = scene.texel_texture_size
+        self.target_density = scene.texel_target_density
+        self.threshold = scene.texel_tolerance
+        return self.execute(context)
+
     def execute(self, context):
         selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
         if not selected_objects:
             self.report({'WARNING'}, "No selected mesh objects")
             return {'CANCELLED'}
 
+        if self.batch_mode:
+            return self.execute_batch(context, selected_objects)
+
         found_issues = False
 
         for obj in selected_objects:
@@ -568,20 +1337,24 @@ class UVTextureScaleCheckerOperator(Operator):
             for face in bm.faces:
                 face.select = False
 
-            islands = self.get_uv_islands(bm, uv_layer)
+            islands = self.get_uv_islands(bm, uv_layer, obj)
+            if islands is None:
+                self.report({'ERROR'}, f"UV islands of {obj.name} are out of sync with the edit mesh, skipped")
+                bpy.ops.object.mode_set(mode='OBJECT')
+                continue
             
             for island in islands:
                 density = self.calculate_island_density(island, uv_layer)
-                density_diff = abs((density - self.TARGET_DENSITY) / self.TARGET_DENSITY) * 100
+                density_diff = abs((density - self.target_density) / self.target_density) * 100
                 
-                if density_diff > self.THRESHOLD:
+                if density_diff > self.threshold:
                     found_issues = True
                     for face in island:
                         face.select = True
                     self.report({'INFO'}, 
                         f"Island in {obj.name}: "
                         f"Current density: {density:.0f}, "
-                        f"Target: {self.TARGET_DENSITY}, "
+                        f"Target: {self.target_density:.0f}, "
                         f"Diff: {density_diff:.1f}%")
 
             bmesh.update_edit_mesh(obj.data)
@@ -592,6 +1365,110 @@ class UVTextureScaleCheckerOperator(Operator):
 
         return {'FINISHED'}
 
+class UVTexelDensityHeatmapOperator(Operator):
+    bl_idname = "object.uv_texel_density_heatmap"
+    bl_label = "Texel Density Heatmap"
+    bl_description = "Write the per-face texel density deviation into a color attribute (blue: too low, green: on target, red: too high)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    attribute_name: StringProperty(
+        name="Attribute",
+        description="Name of the color attribute that receives the heatmap",
+        default="TexelDensity"
+    )
+
+    texture_size: IntProperty(
+        name="Texture Size",
+        description="Texture resolution used to compute the texel density",
+        default=2048,
+        min=1
+    )
+
+    target_density: FloatProperty(
+        name="Target Density",
+        description="Expected texel density in pixels per meter",
+        default=1024.0,
+        min=0.001
+    )
+
+    threshold: FloatProperty(
+        name="Tolerance",
+        description="Deviation in percent still shown as on target",
+        default=1.0,
+        min=0.0,
+        subtype='PERCENTAGE'
+    )
+
+    color_range: FloatProperty(
+        name="Range",
+        description="Deviation in percent mapped to full blue or full red",
+        default=50.0,
+        min=0.1,
+        subtype='PERCENTAGE'
+    )
+
+    def invoke(self, context, event):
+        scene = context.scene
+        self.texture_size = scene.texel_texture_size
+        self.target_density = scene.texel_target_density
+        self.threshold = scene.texel_tolerance
+        return self.execute(context)
+
+    def face_colors(self, entry, matrix_world):
+        """Map the per-face density deviation to RGBA colors"""
+        world_area = world_face_areas(entry['area_vectors'], matrix_world)
+        uv_area = np.abs(entry['uv_area'])
+
+        valid = (world_area > 0) & (uv_area > 0)
+        density = np.zeros(len(world_area))
+        density[valid] = np.sqrt(uv_area[valid] * self.texture_size * self.texture_size / world_area[valid])
+        deviation = (density - self.target_density) / self.target_density * 100
+        deviation[np.abs(deviation) <= self.threshold] = 0.0
+
+        t = np.clip(deviation / self.color_range, -1.0, 1.0)
+        colors = np.zeros((len(t), 4), dtype=np.float32)
+        colors[:, 0] = np.maximum(t, 0.0)
+        colors[:, 1] = 1.0 - np.abs(t)
+        colors[:, 2] = np.maximum(-t, 0.0)
+        colors[:, 3] = 1.0
+        # Facce degeneri in nero
+        colors[~valid, :3] = 0.0
+        return colors, int(np.count_nonzero(deviation < 0)), int(np.count_nonzero(deviation > 0))
+
+    def execute(self, context):
+        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not selected_objects:
+            self.report({'WARNING'}, "No selected mesh objects")
+            return {'CANCELLED'}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        for obj in selected_objects:
+            mesh = obj.data
+            entry = uv_island_cache.get(mesh)
+            if entry is None:
+                self.report({'WARNING'}, f"Object {obj.name} has no active UV layer")
+                continue
+
+            colors, low, high = self.face_colors(entry, obj.matrix_world)
+            loop_colors = np.repeat(colors, entry['buffers']['loop_total'], axis=0)
+
+            attribute = mesh.color_attributes.get(self.attribute_name)
+            if attribute is not None and (attribute.domain != 'CORNER' or attribute.data_type != 'FLOAT_COLOR'):
+                mesh.color_attributes.remove(attribute)
+                attribute = None
+            if attribute is None:
+                attribute = mesh.color_attributes.new(name=self.attribute_name, type='FLOAT_COLOR', domain='CORNER')
+
+            attribute.data.foreach_set("color", loop_colors.ravel())
+            mesh.color_attributes.active_color = attribute
+            mesh.update()
+
+            self.report({'INFO'}, f"{obj.name}: {low} faces below and {high} faces above target density")
+
+        return {'FINISHED'}
+
 class MeshNameChecker(bpy.types.Operator):
     bl_idname = "object.name_checker"
     bl_label = "Name Checker"
@@ -726,10 +1603,15 @@ def create_object_copy(obj_high, original_collection, original_name):
     original_collection.objects.link(obj_low)
     return obj_low
 
-def process_mesh(obj_high, obj_low):
+def process_mesh(obj_high, obj_low, batch_decimate_ratio=None):
     """Apply decimation and processing to a mesh."""
     try:
-        batch_decimate_ratio = bpy.context.scene.batch_decimate_ratio
+        if batch_decimate_ratio is None:
+            batch_decimate_ratio = bpy.context.scene.batch_decimate_ratio
+
+        if bpy.context.scene.use_modifier_stack:
+            decimate_with_modifier_stack(obj_high, obj_low, batch_decimate_ratio)
+            return True
 
         bpy.context.view_layer.objects.active = obj_low
         obj_low.select_set(True)
@@ -791,12 +1673,167 @@ def process_mesh(obj_high, obj_low):
         obj_low.select_set(False)
         return False
 
+def distribute_triangle_budget(triangle_counts, weights, budget):
+    """Water-filling split of a triangle budget proportional to weights, never above the current count; returns per-object ratios."""
+    triangle_counts = np.asarray(triangle_counts, dtype=np.float64)
+    weights = np.maximum(np.asarray(weights, dtype=np.float64), 1e-12)
+    targets = np.zeros(len(triangle_counts))
+    capped = np.zeros(len(triangle_counts), dtype=bool)
+    
+    # Gli oggetti che riceverebbero più triangoli di quelli che hanno restano interi,
+    # e il budget avanzato si ridistribuisce sugli altri
+    while True:
+        free = ~capped
+        remaining = budget - triangle_counts[capped].sum()
+        if not free.any() or remaining <= 0:
+            break
+        targets[free] = remaining * weights[free] / weights[free].sum()
+        over = free & (targets >= triangle_counts)
+        if not over.any():
+            break
+        capped |= over
+    
+    targets[capped] = triangle_counts[capped]
+    ratios = np.divide(targets, triangle_counts, out=np.ones(len(triangle_counts)), where=triangle_counts > 0)
+    return np.clip(ratios, 0.0001, 1.0)
+
+def decimate_source(obj):
+    """The _high object a low object was generated from, or the object itself."""
+    source = bpy.data.objects.get(obj.get("smth_decimate_source", ""))
+    return source if source is not None and source.type == 'MESH' else obj
+
+# Proprietà dei modificatori che riguardano solo interfaccia o statistiche, non il risultato
+MODIFIER_SIGNATURE_SKIP = {"rna_type", "show_expanded", "is_active", "is_override_data_editable", "execution_time"}
+
+def modifier_stack_signature(obj):
+    """Text signature of the type, visibility and settings of every modifier of an object."""
+    parts = []
+    for mod in obj.modifiers:
+        values = []
+        for prop in mod.bl_rna.properties:
+            if prop.identifier in MODIFIER_SIGNATURE_SKIP or prop.type == 'COLLECTION':
+                continue
+            value = getattr(mod, prop.identifier)
+            if prop.type == 'POINTER':
+                value = getattr(value, "name", None)
+            elif isinstance(value, set):
+                value = sorted(value)
+            elif hasattr(value, "__len__") and not isinstance(value, str):
+                value = tuple(value)
+            values.append(f"{prop.identifier}={value}")
+        
+        # Gli input dei Geometry Nodes sono proprietà personalizzate del modificatore
+        for key in mod.keys():
+            value = mod[key]
+            values.append(f"{key}={value.to_list() if hasattr(value, 'to_list') else value}")
+        parts.append(f"{mod.type}({','.join(values)})")
+    return "|".join(parts)
+
+def decimate_hash(obj_high, ratio):
+    """Hash of the source geometry, seams, normals, UVs, modifiers and transform plus the decimation settings."""
+    mesh = obj_high.data
+    buffers = read_mesh_buffers(mesh)
+    arrays = [buffers['co'], buffers['loop_vert'], np.array(obj_high.matrix_world)]
+    arrays += [read_uv_buffer(mesh, uv_layer) for uv_layer in mesh.uv_layers]
+    
+    # Le cuciture definiscono il gruppo EdgeProtection
+    seams = np.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_seam", seams)
+    arrays.append(seams)
+    
+    # Le normali personalizzate sono quelle copiate dal trasferimento
+    if mesh.has_custom_normals:
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get("vector", normals)
+        arrays.append(normals)
+    
+    # Il DataTransfer legge la mesh valutata, quindi conta anche lo stack della sorgente
+    settings = f"{ratio:.6f}|{bpy.context.scene.use_modifier_stack}|{modifier_stack_signature(obj_high)}"
+    return f"{zlib.crc32(settings.encode(), mesh_content_hash(*arrays)):08x}"
+
 class MESH_OT_collection_batch_decimate(Operator):
     bl_idname = "mesh.collection_batch_decimate"
     bl_label = "Process Selected"
     bl_description = "Decimate collapse selected objects from collection"
     bl_options = {'REGISTER', 'UNDO'}
 
+    def decimate_ratios(self, scene, mesh_process_map, sources):
+        """Ratio of every object to process, from the triangle budget or the global ratio"""
+        to_process = [obj for obj, should_process in mesh_process_map.items() if should_process]
+        if not scene.use_triangle_budget:
+            return {obj: scene.batch_decimate_ratio for obj in to_process}
+
+        # Gli oggetti esclusi restano interi e consumano parte del budget
+        fixed = sum(get_triangle_count(obj) for obj, should_process in mesh_process_map.items() if not should_process)
+        triangle_counts = [get_triangle_count(sources[obj]) for obj in to_process]
+        if scene.budget_weighting == 'SCREEN_SIZE':
+            weights = [sources[obj].dimensions.length for obj in to_process]
+        else:
+            weights = triangle_counts
+
+        ratios = distribute_triangle_budget(triangle_counts, weights, scene.triangle_budget - fixed)
+        return dict(zip(to_process, ratios.tolist()))
+
+    def report_budget(self, scene, collection):
+        total = sum(get_triangle_count(obj) for obj in collection.objects if obj.type == 'MESH')
+        deviation = (total - scene.triangle_budget) / max(scene.triangle_budget, 1) * 100
+        level = {'INFO'} if abs(deviation) <= scene.budget_tolerance else {'WARNING'}
+        self.report(level, f"Triangles: {total:,} / budget {scene.triangle_budget:,} ({deviation:+.1f}%)")
+
+    def prepare_source(self, obj, high_collection, sources, ratios):
+        """Return (source, low name, hash) for an object to rebuild, None if its low version is up to date"""
+        source = sources[obj]
+        content_hash = decimate_hash(source, ratios[obj])
+
+        if source is obj:
+            # Primo passaggio: l'originale diventa la sorgente _high
+            return source, move_original_to_high_collection(obj, high_collection), content_hash
+
+        if obj.get("smth_decimate_hash") == content_hash:
+            self.report({'INFO'}, f"Up to date: {obj.name}")
+            return None
+
+        # Versione low non aggiornata: viene ricostruita con lo stesso nome
+        original_name = obj.name
+        old_mesh = obj.data
+        bpy.data.objects.remove(obj)
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+        return source, original_name, content_hash
+
+    def execute_parallel(self, context, mesh_process_map, collection, high_collection, ratios, sources):
+        jobs = []
+        hashes = {}
+        for obj, should_process in mesh_process_map.items():
+            if should_process:
+                ratio = ratios[obj]
+                prepared = self.prepare_source(obj, high_collection, sources, ratios)
+                if prepared:
+                    source, original_name, hashes[source] = prepared
+                    jobs.append((source, collection, original_name, ratio))
+            else:
+                self.report({'INFO'}, f"Skipped: {obj.name}")
+
+        results = decimate_parallel(jobs, context.scene.decimate_workers) if jobs else {}
+
+        for obj, original_collection, original_name, ratio in jobs:
+            obj_low = results.get(obj)
+            if obj_low is None:
+                # Se il worker è fallito, processa l'oggetto qui
+                obj_low = create_object_copy(obj, collection, original_name)
+                if not process_mesh(obj, obj_low, ratio):
+                    self.report({'WARNING'}, f"Error processing {original_name}, copied without changes")
+                    continue
+            obj_low["smth_decimate_hash"] = hashes[obj]
+            obj_low["smth_decimate_source"] = obj.name
+            reduction = (1 - len(obj_low.data.vertices)/len(obj.data.vertices))*100
+            self.report({'INFO'}, f"Processed: {original_name} - Reduction: {reduction:.1f}%")
+
+        if context.scene.use_triangle_budget:
+            self.report_budget(context.scene, collection)
+
+        return {'FINISHED'}
+
     def execute(self, context):
         scene = context.scene
         collection = scene.collection_to_process
@@ -814,17 +1851,29 @@ class MESH_OT_collection_batch_decimate(Operator):
                           if item.name == obj.name}
 
         high_collection = create_high_collection(collection)
+        sources = {obj: decimate_source(obj) for obj in mesh_process_map}
+        ratios = self.decimate_ratios(scene, mesh_process_map, sources)
+
+        if scene.decimate_parallel and sum(mesh_process_map.values()) > 1:
+            return self.execute_parallel(context, mesh_process_map, collection, high_collection, ratios, sources)
 
         for obj, should_process in mesh_process_map.items():
+            name = obj.name
             try:
                 if should_process:
                     # Only move and process objects that are selected for processing
-                    original_name = move_original_to_high_collection(obj, high_collection)
-                    obj_low = create_object_copy(obj, collection, original_name)
+                    ratio = ratios[obj]
+                    prepared = self.prepare_source(obj, high_collection, sources, ratios)
+                    if not prepared:
+                        continue
+                    source, original_name, content_hash = prepared
+                    obj_low = create_object_copy(source, collection, original_name)
                     
-                    success = process_mesh(obj, obj_low)
+                    success = process_mesh(source, obj_low, ratio)
                     if success:
-                        reduction = (1 - len(obj_low.data.vertices)/len(obj.data.vertices))*100
+                        obj_low["smth_decimate_hash"] = content_hash
+                        obj_low["smth_decimate_source"] = source.name
+                        reduction = (1 - len(obj_low.data.vertices)/len(source.data.vertices))*100
                         self.report({'INFO'}, f"Processed: {original_name} - Reduction: {reduction:.1f}%")
                     else:
                         self.report({'WARNING'}, f"Error processing {original_name}, copied without changes")
@@ -833,9 +1882,12 @@ class MESH_OT_collection_batch_decimate(Operator):
                     self.report({'INFO'}, f"Skipped: {obj.name}")
 
             except Exception as e:
-                self.report({'WARNING'}, f"Error handling {obj.name}: {str(e)}")
+                self.report({'WARNING'}, f"Error handling {name}: {str(e)}")
                 continue
 
+        if scene.use_triangle_budget:
+            self.report_budget(scene, collection)
+
         return {'FINISHED'}
 
 def find_common_prefix(names):
@@ -917,9 +1969,9 @@ def is_face_flipped(face, uv_layer, epsilon=1e-6):
     # Extract the first three UV vertices
     uv1, uv2, uv3 = (loop[uv_layer].uv for loop in face.loops[:3])
     
-    # Calculate the 3D area using the cross product
+    # Calculate the 3D area using the cross product, signed by the face normal
     normal_3d = (v2 - v1).cross(v3 - v1)
-    area_3d = normal_3d.length  # # Magnitude of the normal vector
+    area_3d = normal_3d.dot(face.normal)
     
     # Calculate the UV area using the determinant
     area_uv = (uv2.x - uv1.x) * (uv3.y - uv1.y) - (uv2.y - uv1.y) * (uv3.x - uv1.x)
@@ -931,13 +1983,109 @@ def is_face_flipped(face, uv_layer, epsilon=1e-6):
     # The face is flipped if the sign of the two areas is opposite
     return (area_3d < 0) != (area_uv < 0)
 
+def uv_corner_flips(uv, buffers, normals, epsilon=1e-6):
+    """Faces whose UV winding disagrees with their 3D winding around the face normal, voted per corner and weighted by corner area."""
+    loop_face = buffers['loop_face']
+    loop_next = buffers['loop_next']
+    loop_prev = np.empty_like(loop_next)
+    loop_prev[loop_next] = np.arange(len(loop_next))
+    face_count = len(buffers['loop_start'])
+    
+    # Orientamento di ogni angolo: in 3D rispetto alla normale della faccia, in UV rispetto all'asse Z
+    positions = buffers['co'][buffers['loop_vert']]
+    cross_3d = np.cross(positions[loop_next] - positions, positions[loop_prev] - positions)
+    corner_3d = np.einsum('ij,ij->i', cross_3d, normals[loop_face])
+    
+    uv = uv.astype(np.float64)
+    to_next = uv[loop_next] - uv
+    to_prev = uv[loop_prev] - uv
+    corner_uv = to_next[:, 0] * to_prev[:, 1] - to_next[:, 1] * to_prev[:, 0]
+    
+    weight = np.where((np.abs(corner_3d) > epsilon) & (np.abs(corner_uv) > epsilon), np.abs(corner_3d), 0.0)
+    disagree = np.bincount(loop_face, weights=np.where(np.sign(corner_3d) != np.sign(corner_uv), weight, 0.0), minlength=face_count)
+    total = np.bincount(loop_face, weights=weight, minlength=face_count)
+    return disagree > total * 0.5
+
+def find_flipped_uv_faces(mesh, uv_layers=None, epsilon=1e-6, buffers=None, use_normals=True):
+    """Faces with flipped UVs on any of the given UV layers (all layers by default), plus the count per layer."""
+    # Riusa geometria e UV del layer attivo solo se le isole sono già in cache:
+    # costruirle qui costerebbe molto più della lettura diretta dei buffer
+    active_layer = mesh.uv_layers.active
+    entry = None
+    if buffers is None and active_layer:
+        entry = uv_island_cache.get(mesh, active_layer, build=False)
+    if buffers is None:
+        buffers = entry['buffers'] if entry is not None else read_mesh_buffers(mesh)
+    if uv_layers is None:
+        uv_layers = mesh.uv_layers
+    
+    normals = None
+    if use_normals:
+        normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+        mesh.polygons.foreach_get("normal", normals)
+        normals = normals.reshape(-1, 3).astype(np.float64)
+    
+    flipped = np.zeros(len(buffers['loop_start']), dtype=bool)
+    counts = {}
+    for uv_layer in uv_layers:
+        if entry is not None and uv_layer.name == active_layer.name:
+            uv = entry['uv']
+        else:
+            uv = read_uv_buffer(mesh, uv_layer)
+        if use_normals:
+            layer_flipped = uv_corner_flips(uv, buffers, normals, epsilon)
+        else:
+            layer_flipped = uv_signed_areas(uv, buffers) < -epsilon
+        counts[uv_layer.name] = int(np.count_nonzero(layer_flipped))
+        flipped |= layer_flipped
+    
+    return flipped, counts
+
 class MESH_OT_find_flip_UV(Operator):
     bl_idname = "mesh.find_flip_uv"
     bl_label = "Find Flipped UV"
     bl_description = "Find Flipped UV"
     bl_options = {'REGISTER', 'UNDO'}
 
+    use_batch: BoolProperty(
+        name="Batch",
+        description="Check every UV layer of all selected meshes at once in Object Mode",
+        default=True
+    )
+
+    use_normals: BoolProperty(
+        name="Use Normals",
+        description="Compare the UV winding of every corner with its winding around the face normal, robust on concave and non-planar faces",
+        default=True
+    )
+
+    def execute_batch(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        total_flipped = 0
+        for obj in context.selected_objects:
+            if obj.type != 'MESH':
+                continue
+
+            me = obj.data
+            if not me.uv_layers:
+                print(f"L'oggetto {obj.name} non ha layer UV")
+                continue
+
+            flipped, counts = find_flipped_uv_faces(me, use_normals=self.use_normals)
+            me.polygons.foreach_set("select", flipped)
+            me.update()
+            total_flipped += int(flipped.sum())
+
+            print(f"Found flipped faces in {obj.name}: " + ", ".join(f"{name}: {count}" for name, count in counts.items()))
+
+        self.report({'INFO'}, f"Found {total_flipped} faces with flipped UVs")
+        return {'FINISHED'}
+
     def execute(self, context):
+        if self.use_batch:
+            return self.execute_batch(context)
 
         # Get selected objects
         selected_objects = bpy.context.selected_objects
@@ -977,7 +2125,6 @@ class MESH_OT_find_flip_UV(Operator):
 
             # Update the mesh of the current object
             bmesh.update_edit_mesh(me)
-            bm.free()  # Free the BMesh
 
             print(f"Found {flipped_count} faces flipped in {obj.name}")
 
@@ -989,13 +2136,77 @@ def get_uv_bounds(uv_coords):
     max_uv = mathutils.Vector((max(uv.x for uv in uv_coords), max(uv.y for uv in uv_coords)))
     return min_uv, max_uv
 
+def mirror_flipped_uv_islands(mesh, epsilon=1e-6):
+    """Mirror in U every island of the active UV layer whose area is mostly flipped, around its bounding box centre."""
+    uv_layer = mesh.uv_layers.active
+    entry = uv_island_cache.get(mesh, uv_layer)
+    if entry is None:
+        return 0
+
+    face_islands = entry['face_islands']
+    island_count = entry['island_count']
+    flipped_faces, _ = find_flipped_uv_faces(mesh, [uv_layer], epsilon, use_normals=True)
+
+    # Un'isola si ribalta se la maggior parte della sua area UV è ribaltata,
+    # con lo stesso criterio per angolo e normale usato da Find Flipped UV
+    area = np.abs(entry['uv_area'])
+    flipped_area = np.bincount(face_islands, weights=np.where(flipped_faces, area, 0.0), minlength=island_count)
+    total_area = np.bincount(face_islands, weights=area, minlength=island_count)
+    flipped_islands = flipped_area > total_area * 0.5
+    if not flipped_islands.any():
+        return 0
+
+    loop_islands = face_islands[entry['buffers']['loop_face']]
+    uv = entry['uv'].copy()
+    min_u = np.full(island_count, np.inf)
+    max_u = np.full(island_count, -np.inf)
+    np.minimum.at(min_u, loop_islands, uv[:, 0])
+    np.maximum.at(max_u, loop_islands, uv[:, 0])
+
+    mirror = flipped_islands[loop_islands]
+    uv[mirror, 0] = (min_u + max_u)[loop_islands[mirror]] - uv[mirror, 0]
+
+    uv_layer.data.foreach_set("uv", uv.ravel())
+    mesh.update()
+    return int(np.count_nonzero(flipped_islands))
+
 class MESH_OT_fix_flipped_uv_faces(bpy.types.Operator):
     bl_idname = "mesh.fix_uv_flipped"
     bl_label = "Fix Flipped UV"
     bl_description = "Fixes flipped UVs while maintaining the same position and scale"
     bl_options = {'REGISTER', 'UNDO'}
     
+    use_islands: BoolProperty(
+        name="Whole Islands",
+        description="Mirror whole flipped islands on all selected meshes instead of single faces of the active object",
+        default=True
+    )
+    
+    def execute_islands(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        
+        fixed_islands = 0
+        fixed_objects = 0
+        for obj in context.selected_objects:
+            if obj.type != 'MESH':
+                continue
+            if not obj.data.uv_layers:
+                self.report({'WARNING'}, f"Object {obj.name} has no UV layers")
+                continue
+            
+            count = mirror_flipped_uv_islands(obj.data)
+            if count:
+                fixed_islands += count
+                fixed_objects += 1
+        
+        self.report({'INFO'}, f"Fixed {fixed_islands} flipped UV islands on {fixed_objects} objects.")
+        return {'FINISHED'}
+    
     def execute(self, context):
+        if self.use_islands:
+            return self.execute_islands(context)
+        
         bpy.ops.object.mode_set(mode='EDIT')  # Enter in Edit Mode
         
         obj = bpy.context.active_object
@@ -1049,7 +2260,11 @@ def create_high_collection(original_collection):
     return high_collection
 
 def create_edge_vertex_group(obj):
-    """Create vertex group for boundary edges and seams."""
+    """Create vertex group for boundary edges and seams, replacing an existing one."""
+    # Le copie di mesh già decimate hanno il gruppo del livello precedente
+    vg = obj.vertex_groups.get("EdgeProtection")
+    if vg:
+        obj.vertex_groups.remove(vg)
     vg = obj.vertex_groups.new(name="EdgeProtection")
     bm = bmesh.new()
     bm.from_mesh(obj.data)
@@ -1095,6 +2310,69 @@ def transfer_data(source, target):
         mod.loop_mapping = 'POLYINTERP_NEAREST'
         bpy.ops.object.modifier_apply(modifier=mod.name)
 
+def decimate_with_modifier_stack(obj_high, obj_low, ratio=0.5, smooth=True):
+    """Stack decimate, smooth and data transfer modifiers and bake them with a single depsgraph evaluation."""
+    create_edge_vertex_group(obj_low)
+    modifiers = []
+    
+    # I modificatori copiati dalla sorgente restano attivi sulla copia: vengono esclusi
+    # dalla valutazione, come faceva modifier_apply, e ripristinati dopo
+    existing = [(mod, mod.show_viewport) for mod in obj_low.modifiers]
+    for mod, _ in existing:
+        mod.show_viewport = False
+    
+    try:
+        mod = obj_low.modifiers.new(name="Decimate", type='DECIMATE')
+        mod.ratio = ratio
+        mod.vertex_group = "EdgeProtection"
+        mod.invert_vertex_group = True
+        modifiers.append(mod)
+        
+        if smooth:
+            mod = obj_low.modifiers.new(name="Smooth", type='SMOOTH')
+            mod.factor = 0.5
+            mod.iterations = 4
+            mod.vertex_group = "EdgeProtection"
+            mod.invert_vertex_group = True
+            modifiers.append(mod)
+        
+        mod = obj_low.modifiers.new(name="NormalTransfer", type='DATA_TRANSFER')
+        mod.object = obj_high
+        mod.use_loop_data = True
+        mod.data_types_loops = {'CUSTOM_NORMAL'}
+        mod.loop_mapping = 'POLYINTERP_NEAREST'
+        modifiers.append(mod)
+        
+        if obj_high.data.uv_layers:
+            if not obj_low.data.uv_layers:
+                obj_low.data.uv_layers.new()
+            mod = obj_low.modifiers.new(name="UVTransfer", type='DATA_TRANSFER')
+            mod.object = obj_high
+            mod.use_loop_data = True
+            mod.data_types_loops = {'UV'}
+            mod.loop_mapping = 'POLYINTERP_NEAREST'
+            modifiers.append(mod)
+        
+        # Una sola valutazione dello stack, senza modifier_apply né oggetto attivo
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        obj_eval = obj_low.evaluated_get(depsgraph)
+        new_mesh = bpy.data.meshes.new_from_object(obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph)
+    finally:
+        # Anche se la valutazione fallisce, l'oggetto torna com'era
+        for mod in modifiers:
+            obj_low.modifiers.remove(mod)
+        for mod, show_viewport in existing:
+            mod.show_viewport = show_viewport
+    
+    old_mesh = obj_low.data
+    mesh_name = old_mesh.name
+    obj_low.data = new_mesh
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+    new_mesh.name = mesh_name
+    
+    return obj_low
+
 def move_original_to_high_collection(obj, high_collection):
     """Move the original object to the high collection and rename it."""
     original_name = obj.name
@@ -1112,6 +2390,16 @@ def decimate_mesh(obj_high, original_collection, original_name, batch_decimate_r
     obj_low.name = original_name
     original_collection.objects.link(obj_low)
     
+    return decimate_object(obj_high, obj_low, batch_decimate_ratio)
+
+def decimate_object(obj_high, obj_low, batch_decimate_ratio=0.5, use_modifier_stack=None, smooth=True):
+    """Decimate obj_low in place, smoothing it and transferring normals and UVs from obj_high."""
+    if use_modifier_stack is None:
+        use_modifier_stack = bpy.context.scene.use_modifier_stack
+    
+    if use_modifier_stack:
+        return decimate_with_modifier_stack(obj_high, obj_low, batch_decimate_ratio, smooth)
+    
     # Set as active object
     bpy.context.view_layer.objects.active = obj_low
     obj_low.select_set(True)
@@ -1123,7 +2411,7 @@ def decimate_mesh(obj_high, original_collection, original_name, batch_decimate_r
     apply_decimation(obj_low, batch_decimate_ratio)
     
     # Apply smooth modifier with edge protection
-    if "EdgeProtection" in obj_low.vertex_groups:
+    if smooth and "EdgeProtection" in obj_low.vertex_groups:
         mod = obj_low.modifiers.new(name="Smooth", type='SMOOTH')
         mod.factor = 0.5
         mod.iterations = 4
@@ -1137,12 +2425,166 @@ def decimate_mesh(obj_high, original_collection, original_name, batch_decimate_r
     obj_low.select_set(False)
     return obj_low
 
+# Tipi di dati che un oggetto sorgente può trascinare nel file scritto per i worker
+# (parent, target dei modificatori, mesh, materiali, texture, azioni)
+DECIMATE_DEPENDENCY_TYPES = (
+    "objects", "meshes", "curves", "armatures", "lattices", "materials",
+    "images", "textures", "node_groups", "actions",
+)
+DECIMATE_SOURCE_KEY = "smth_decimate_dependency"
+
+# Script eseguito da ogni worker in background: importa questo modulo senza registrarlo
+# e decima gli oggetti del proprio blocco con la stessa modalità scelta nella scena
+DECIMATE_WORKER_SCRIPT = """
+import bpy, sys, json, importlib.util
+
+with open(sys.argv[sys.argv.index("--") + 1]) as job_file:
+    args = json.load(job_file)
+
+spec = importlib.util.spec_from_file_location("smth_decimate_worker", args["addon"])
+addon = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(addon)
+
+# Svuota il file di fabbrica, così le dipendenze caricate mantengono i nomi originali
+for data_type in addon.DECIMATE_DEPENDENCY_TYPES:
+    data = getattr(bpy.data, data_type)
+    for id_data in list(data):
+        data.remove(id_data)
+
+with bpy.data.libraries.load(args["source"]) as (data_from, data_to):
+    data_to.objects = [job["high"] for job in args["jobs"]]
+
+collection = bpy.context.scene.collection
+results = set()
+for job, obj_high in zip(args["jobs"], data_to.objects):
+    collection.objects.link(obj_high)
+    obj_low = obj_high.copy()
+    obj_low.data = obj_high.data.copy()
+    obj_low.name = job["low"]
+    collection.objects.link(obj_low)
+    addon.decimate_object(obj_high, obj_low, job["ratio"], args["use_modifier_stack"])
+    results.add(obj_low)
+
+# Marca ogni dipendenza con il suo nome originale, per rimapparla sull'originale dopo l'append
+owned = results | {obj.data for obj in results}
+for data_type in addon.DECIMATE_DEPENDENCY_TYPES:
+    for id_data in getattr(bpy.data, data_type):
+        if id_data not in owned and not id_data.library:
+            id_data[addon.DECIMATE_SOURCE_KEY] = id_data.name
+
+bpy.data.libraries.write(args["output"], results, fake_user=True)
+"""
+
+def remap_decimate_dependencies():
+    """Point users of the data-blocks appended with the worker results back to the originals and delete the copies."""
+    copies = []
+    for data_type in DECIMATE_DEPENDENCY_TYPES:
+        data = getattr(bpy.data, data_type)
+        for id_data in list(data):
+            source_name = id_data.get(DECIMATE_SOURCE_KEY)
+            if source_name is None:
+                continue
+            
+            del id_data[DECIMATE_SOURCE_KEY]
+            original = data.get(source_name)
+            if original is None or original == id_data:
+                # L'originale non esiste più: la copia resta come dato normale
+                id_data.use_fake_user = False
+                continue
+            
+            id_data.user_remap(original)
+            copies.append((data, id_data))
+    
+    for data, id_data in copies:
+        data.remove(id_data)
+
+def decimate_parallel(jobs, workers=4):
+    """Decimate (obj_high, collection, low name, ratio) jobs in background Blender workers and link the results back."""
+    work_dir = tempfile.mkdtemp(prefix="smth_decimate_")
+    results = {}
+    
+    try:
+        source_path = os.path.join(work_dir, "source.blend")
+        bpy.data.libraries.write(source_path, {job[0] for job in jobs}, fake_user=True)
+        
+        script_path = os.path.join(work_dir, "worker.py")
+        with open(script_path, 'w') as script_file:
+            script_file.write(DECIMATE_WORKER_SCRIPT)
+        
+        # Distribuisce i job più pesanti per primi, a turno tra i worker
+        ordered = sorted(jobs, key=lambda job: len(job[0].data.polygons), reverse=True)
+        chunks = [ordered[index::workers] for index in range(min(workers, len(ordered)))]
+        
+        processes = []
+        for index, chunk in enumerate(chunks):
+            output_path = os.path.join(work_dir, f"output_{index}.blend")
+            job_path = os.path.join(work_dir, f"jobs_{index}.json")
+            with open(job_path, 'w') as job_file:
+                json.dump({
+                    'addon': os.path.realpath(__file__),
+                    'source': source_path,
+                    'output': output_path,
+                    'use_modifier_stack': bpy.context.scene.use_modifier_stack,
+                    'jobs': [{'high': job[0].name, 'low': job[2], 'ratio': job[3]} for job in chunk],
+                }, job_file)
+            
+            process = subprocess.Popen([bpy.app.binary_path, "--background", "--factory-startup",
+                                        "--python", script_path, "--", job_path])
+            processes.append((process, chunk, output_path))
+        
+        for process, chunk, output_path in processes:
+            if process.wait() != 0 or not os.path.exists(output_path):
+                print(f"Decimate worker failed with code {process.returncode}")
+                continue
+            
+            with bpy.data.libraries.load(output_path) as (data_from, data_to):
+                data_to.objects = [job[2] for job in chunk]
+            
+            for (obj_high, original_collection, original_name, ratio), obj_low in zip(chunk, data_to.objects):
+                if obj_low is None:
+                    continue
+                
+                original_collection.objects.link(obj_low)
+                obj_low.use_fake_user = False
+                obj_low.data.use_fake_user = False
+                obj_low.parent = obj_high.parent
+                obj_low.matrix_parent_inverse = obj_high.matrix_parent_inverse.copy()
+                obj_low.matrix_world = obj_high.matrix_world.copy()
+                
+                results[obj_high] = obj_low
+        
+        remap_decimate_dependencies()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    return results
+
 class MESH_OT_batch_decimate(Operator):
     """Batch process selected meshes with decimation"""
     bl_idname = "mesh.batch_decimate"
     bl_label = "Decimate Collapse Meshes"
     bl_options = {'REGISTER', 'UNDO'}
     
+    def execute_parallel(self, context, selected_meshes):
+        jobs = []
+        for obj in selected_meshes:
+            original_collection = obj.users_collection[0]
+            high_collection = create_high_collection(original_collection)
+            original_name = move_original_to_high_collection(obj, high_collection)
+            jobs.append((obj, original_collection, original_name, context.scene.decimate_ratio))
+        
+        results = decimate_parallel(jobs, context.scene.decimate_workers)
+        
+        for obj, original_collection, original_name, ratio in jobs:
+            try:
+                # Se il worker è fallito, decima l'oggetto qui
+                obj_low = results.get(obj) or decimate_mesh(obj, original_collection, original_name, ratio)
+                self.report({'INFO'}, f"Processed: {original_name} - Reduction: {(1 - len(obj_low.data.vertices)/len(obj.data.vertices))*100:.1f}%")
+            except Exception as e:
+                self.report({'ERROR'}, f"Error processing {obj.name}: {str(e)}")
+        
+        return {'FINISHED'}
+    
     def execute(self, context):
         selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
         
@@ -1153,6 +2595,9 @@ class MESH_OT_batch_decimate(Operator):
         # Deselect all objects
         bpy.ops.object.select_all(action='DESELECT')
         
+        if context.scene.decimate_parallel and len(selected_meshes) > 1:
+            return self.execute_parallel(context, selected_meshes)
+        
         # Process each mesh
         for obj in selected_meshes:
             try:
@@ -1174,6 +2619,87 @@ class MESH_OT_batch_decimate(Operator):
         
         return {'FINISHED'}
 
+def get_lod_collection(original_collection, level):
+    """Create or get the _LOD{n} child collection of the original collection."""
+    lod_name = f"{original_collection.name}_LOD{level}"
+    lod_collection = bpy.data.collections.get(lod_name)
+    
+    if not lod_collection:
+        lod_collection = bpy.data.collections.new(lod_name)
+        original_collection.children.link(lod_collection)
+    
+    return lod_collection
+
+def parse_lod_levels(text, mode='RATIO'):
+    """Parse a comma separated list of positive numbers in descending order."""
+    values = [float(value) for value in text.replace(";", ",").split(",") if value.strip()]
+    if not values or any(value <= 0 for value in values):
+        raise ValueError("LOD levels must be positive numbers")
+    if mode == 'RATIO' and any(value > 1 for value in values):
+        raise ValueError("LOD ratios must not be greater than 1")
+    if any(current >= previous for previous, current in zip(values, values[1:])):
+        raise ValueError("LOD levels must be in descending order")
+    return values
+
+class MESH_OT_generate_lod_chain(Operator):
+    """Generate an LOD chain from selected meshes, each level decimated from the previous one"""
+    bl_idname = "mesh.generate_lod_chain"
+    bl_label = "Generate LOD Chain"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        scene = context.scene
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        
+        if not selected_meshes:
+            self.report({'WARNING'}, "No mesh objects selected")
+            return {'CANCELLED'}
+        
+        try:
+            levels = parse_lod_levels(scene.lod_levels, scene.lod_mode)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        
+        bpy.ops.object.select_all(action='DESELECT')
+        
+        for obj in selected_meshes:
+            try:
+                original_collection = obj.users_collection[0]
+                high_collection = create_high_collection(original_collection)
+                original_name = move_original_to_high_collection(obj, high_collection)
+                
+                # LOD0 è la copia non decimata dell'originale
+                previous = create_object_copy(obj, get_lod_collection(original_collection, 0), f"{original_name}_LOD0")
+                base_triangles = get_triangle_count(previous)
+                smoothed = False
+                
+                for level, value in enumerate(levels, start=1):
+                    target = value * base_triangles if scene.lod_mode == 'RATIO' else value
+                    current = get_triangle_count(previous)
+                    ratio = min(max(target / max(current, 1), 0.0001), 1.0)
+                    
+                    # Ogni livello parte dal precedente, normali e UV arrivano sempre da _high.
+                    # Lo smooth si applica solo alla prima decimazione: ripeterlo a ogni passo
+                    # allontanerebbe i LOD più bassi dalla forma originale. Con ratio 1 il
+                    # livello resta una copia del precedente
+                    obj_lod = create_object_copy(previous, get_lod_collection(original_collection, level), f"{original_name}_LOD{level}")
+                    if ratio < 1.0:
+                        decimate_object(obj, obj_lod, ratio, smooth=not smoothed)
+                        smoothed = True
+                    obj_lod.select_set(False)
+                    previous = obj_lod
+                
+                self.report({'INFO'}, f"Generated {len(levels) + 1} LODs for {original_name} - LOD{len(levels)}: {get_triangle_count(previous):,} triangles")
+                
+            except Exception as e:
+                # Gli oggetti precedenti sono già stati modificati: segnala l'errore e prosegue,
+                # così l'operatore termina con FINISHED e l'undo resta coerente
+                self.report({'ERROR'}, f"Error processing {obj.name}: {str(e)}")
+                continue
+        
+        return {'FINISHED'}
+
 class MESH_OT_batch_decimate_planar(Operator):
     """Batch process selected meshes with planar decimation"""
     bl_idname = "mesh.batch_decimate_planar"
@@ -1301,6 +2827,88 @@ class OBJECT_OT_VertexColorWind(Operator):
         max=10.0
     )
     
+    use_direct: bpy.props.BoolProperty(
+        name="Direct",
+        description="Write the gradient straight into vertex_R, without vertex groups and Weight Paint mode",
+        default=True
+    )
+    
+    generate_channels: bpy.props.BoolProperty(
+        name="Generate G, B, A",
+        description="Also overwrite G with a per-object random phase, B with a per-part stiffness and A with the normalized height (Direct only)",
+        default=False
+    )
+    
+    def spherical_gradient(self, co):
+        """Spherical gradient weight of every vertex, None if all vertices are in the centre"""
+        min_z = co[:, 2].min()
+        
+        # The origin point of the gradient is centered in XY and at the lowest point in Z
+        gradient_origin = np.array((co[:, 0].mean(), co[:, 1].mean(), min_z))
+        distance = np.linalg.norm(co - gradient_origin, axis=1)
+        max_distance = distance.max()
+        if max_distance == 0:
+            return None
+        
+        normalized_distance = distance / max_distance
+        if self.falloff_power != 1.0:
+            normalized_distance = normalized_distance ** self.falloff_power
+        
+        weight = self.min_weight + (self.max_weight - self.min_weight) * normalized_distance
+        return np.clip(weight, self.min_weight, self.max_weight)
+    
+    @staticmethod
+    def wind_channels(obj, co):
+        """Phase, stiffness and height channels of every vertex"""
+        mesh = obj.data
+        vertex_count = len(co)
+        
+        # G: fase casuale ma stabile per oggetto, ricavata dal nome
+        phase = np.full(vertex_count, (zlib.crc32(obj.name.encode()) & 0xFFFF) / 0xFFFF)
+        
+        # B: rigidità di ogni parte connessa in proporzione alla parte più grande
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        labels = union_find_labels(vertex_count, edges[0::2], edges[1::2])
+        sizes = np.bincount(labels)
+        stiffness = sizes[labels] / sizes.max()
+        
+        # A: altezza normalizzata
+        min_z = co[:, 2].min()
+        height = co[:, 2].max() - min_z
+        normalized_height = (co[:, 2] - min_z) / height if height > 0 else np.zeros(vertex_count)
+        
+        return phase, stiffness, normalized_height
+    
+    def execute_direct(self, context, mesh_objects):
+        domain = context.scene.vertex_color_domain
+        
+        for obj in mesh_objects:
+            mesh = obj.data
+            if not len(mesh.vertices):
+                continue
+            
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            weight = self.spherical_gradient(co.reshape(-1, 3).astype(np.float64))
+            if weight is None:
+                self.report({'WARNING'}, f"The object {obj.name} has all vertices in the center. A spherical gradient cannot be applied.")
+                continue
+            
+            channel_layers = [ensure_color_attribute(mesh, name, domain) for name in ("vertex_R", "vertex_G", "vertex_B", "vertex_A")]
+            write_color_channel(mesh, channel_layers[0], weight.astype(np.float32))
+            if self.generate_channels:
+                for layer, values in zip(channel_layers[1:], self.wind_channels(obj, co.reshape(-1, 3))):
+                    write_color_channel(mesh, layer, values.astype(np.float32))
+            
+            rgba_layer = ensure_color_attribute(mesh, "vertex_RGBA", domain)
+            combine_vertex_color_channels(mesh, rgba_layer, channel_layers)
+            mesh.color_attributes.active_color = rgba_layer
+            mesh.color_attributes.render_color_index = mesh.color_attributes.find("vertex_RGBA")
+            mesh.update()
+        
+        return {'FINISHED'}
+    
     def execute(self, context):
         mesh_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
         if not mesh_objects:
@@ -1313,6 +2921,9 @@ class OBJECT_OT_VertexColorWind(Operator):
 
         bpy.ops.object.mode_set(mode='OBJECT')
         
+        if self.use_direct:
+            return self.execute_direct(context, mesh_objects)
+        
         for obj in mesh_objects:
             context.view_layer.objects.active = obj
 
@@ -1383,47 +2994,34 @@ class OBJECT_OT_VertexColorWind(Operator):
             bpy.ops.object.mode_set(mode='WEIGHT_PAINT')
             obj.vertex_groups.active_index = vgroup.index
 
-            if not obj.data.vertex_colors:
-                obj.data.vertex_colors.new(name="vertex_R")
-            else:
-                obj.data.vertex_colors[0].name = "vertex_R"
-
-            color_layers = ["vertex_G", "vertex_B", "vertex_A"]
+            # Crea i canali mancanti senza rinominare attributi esistenti (es. la heatmap TexelDensity)
+            color_layers = ["vertex_R", "vertex_G", "vertex_B", "vertex_A"]
             for color_layer_name in color_layers:
-                if color_layer_name not in obj.data.vertex_colors:
-                    obj.data.vertex_colors.new(name=color_layer_name)
+                ensure_color_attribute(obj.data, color_layer_name, context.scene.vertex_color_domain)
 
         bpy.ops.object.mode_set(mode='VERTEX_PAINT')
         for obj in mesh_objects:
-            if "vertex_R" in obj.data.vertex_colors:
-                obj.data.vertex_colors.active = obj.data.vertex_colors["vertex_R"]
+            if "vertex_R" in obj.data.color_attributes:
+                obj.data.color_attributes.active_color = obj.data.color_attributes["vertex_R"]
                 bpy.context.view_layer.objects.active = obj
                 bpy.ops.paint.vertex_color_from_weight()
             else:
                 self.report({'ERROR'}, f"The object {obj.name} does not have a color layer called 'vertex_R'.")
 
         for obj in mesh_objects:
-            if "vertex_RGBA" not in obj.data.vertex_colors:
-                rgba_layer = obj.data.vertex_colors.new(name="vertex_RGBA")
-            else:
-                rgba_layer = obj.data.vertex_colors["vertex_RGBA"]
+            rgba_layer = ensure_color_attribute(obj.data, "vertex_RGBA", context.scene.vertex_color_domain)
             
-            r_layer = obj.data.vertex_colors.get("vertex_R")
-            g_layer = obj.data.vertex_colors.get("vertex_G")
-            b_layer = obj.data.vertex_colors.get("vertex_B")
-            a_layer = obj.data.vertex_colors.get("vertex_A")
+            r_layer = obj.data.color_attributes.get("vertex_R")
+            g_layer = obj.data.color_attributes.get("vertex_G")
+            b_layer = obj.data.color_attributes.get("vertex_B")
+            a_layer = obj.data.color_attributes.get("vertex_A")
             
             if not (r_layer and g_layer and b_layer and a_layer):
                 self.report({'ERROR'}, f"One or more color channels are missing in '{obj.name}'.")
                 continue
 
-            for poly in obj.data.polygons:
-                for loop_index in poly.loop_indices:
-                    r = r_layer.data[loop_index].color[0]
-                    g = g_layer.data[loop_index].color[0]
-                    b = b_layer.data[loop_index].color[0]
-                    a = a_layer.data[loop_index].color[0]
-                    rgba_layer.data[loop_index].color = (r, g, b, a)
+            combine_vertex_color_channels(obj.data, rgba_layer, (r_layer, g_layer, b_layer, a_layer))
+            obj.data.update()
 
         bpy.ops.object.mode_set(mode='VERTEX_PAINT')
         for obj in mesh_objects:
@@ -2101,9 +3699,28 @@ class OBJECT_OT_UVWBox(Operator):
 class OBJECT_OT_AutoScaleUV(Operator):
     bl_idname = "object.auto_scale_uv"
     bl_label = "World Scale UV"
-    bl_description = "All islands of any object will be scaled to same world unit"
+    bl_description = "All islands of any object will be scaled to the texel density of the active preset"
     bl_options = {'REGISTER', 'UNDO'}
 
+    texture_size: IntProperty(
+        name="Texture Size",
+        description="Texture resolution used to compute the texel density",
+        default=2048,
+        min=1
+    )
+
+    target_density: FloatProperty(
+        name="Target Density",
+        description="Texel density in pixels per meter the islands are scaled to",
+        default=1024.0,
+        min=0.001
+    )
+
+    def invoke(self, context, event):
+        self.texture_size = context.scene.texel_texture_size
+        self.target_density = context.scene.texel_target_density
+        return self.execute(context)
+
     def execute(self, context):
         view_layer = context.view_layer
         obj_active = view_layer.objects.active
@@ -2122,10 +3739,10 @@ class OBJECT_OT_AutoScaleUV(Operator):
         for obj in selection:
             bpy.ops.object.mode_set(mode='EDIT')
             bpy.ops.mesh.select_all(action='SELECT')
-            bpy.context.scene.muv_world_scale_uv_tgt_texture_size[1] = 2048
-            bpy.context.scene.muv_world_scale_uv_tgt_texture_size[0] = 2048
-            bpy.context.scene.muv_world_scale_uv_tgt_density = 1024
-            bpy.ops.uv.muv_world_scale_uv_apply_manual(tgt_density=1024, tgt_texture_size=(2048, 2048), origin='CENTER', show_dialog=False, tgt_area_calc_method='UV ISLAND', only_selected=True)
+            bpy.context.scene.muv_world_scale_uv_tgt_texture_size[1] = self.texture_size
+            bpy.context.scene.muv_world_scale_uv_tgt_texture_size[0] = self.texture_size
+            bpy.context.scene.muv_world_scale_uv_tgt_density = self.target_density
+            bpy.ops.uv.muv_world_scale_uv_apply_manual(tgt_density=self.target_density, tgt_texture_size=(self.texture_size, self.texture_size), origin='CENTER', show_dialog=False, tgt_area_calc_method='UV ISLAND', only_selected=True)
             bpy.ops.object.mode_set(mode='OBJECT')
 
         return {'FINISHED'}
@@ -2949,6 +4566,10 @@ class VIEW3D_PT_Panel69(Panel):
         scene = context.scene        
 
         box69.prop(scene, "decimate_ratio", text="Decimate Ratio", slider=True)
+        box69.prop(scene, "use_modifier_stack")
+        row = box69.row()
+        row.prop(scene, "decimate_parallel")
+        row.prop(scene, "decimate_workers")
         box69.operator("mesh.batch_decimate", icon = 'MOD_DECIM')
         
         col = layout.column()
@@ -2961,6 +4582,14 @@ class VIEW3D_PT_Panel69(Panel):
         box.prop(scene, "planar_angle", text="Angle Threshold (degrees)", slider=True)
         box.operator("mesh.batch_decimate_planar", icon = 'MOD_DECIM')
 
+        col.label(text='LOD Chain:')
+        
+        box = col.box()
+        
+        box.prop(scene, "lod_mode", expand=True)
+        box.prop(scene, "lod_levels")
+        box.operator("mesh.generate_lod_chain", icon = 'MOD_DECIM')
+
         col.label(text='Collapse Decimate Collection:')
         
         scene = context.scene
@@ -2968,7 +4597,17 @@ class VIEW3D_PT_Panel69(Panel):
         box70 = col.box()
         
         box70.prop(scene, "collection_to_process", text='', icon='COLLECTION_COLOR_05')
-        box70.prop(scene, "batch_decimate_ratio", slider=True)
+        box70.prop(scene, "use_triangle_budget")
+        if scene.use_triangle_budget:
+            box70.prop(scene, "triangle_budget")
+            box70.prop(scene, "budget_weighting", text="")
+            box70.prop(scene, "budget_tolerance")
+        else:
+            box70.prop(scene, "batch_decimate_ratio", slider=True)
+        box70.prop(scene, "use_modifier_stack")
+        row = box70.row()
+        row.prop(scene, "decimate_parallel")
+        row.prop(scene, "decimate_workers")
         box70.separator()
         
         if scene.collection_to_process:
@@ -3067,7 +4706,12 @@ class VIEW3D_PT_Panel_Controller(Panel):
         
         box = col.box()
         
+        box.prop(context.scene, "texel_density_preset", text="")
+        box.prop(context.scene, "texel_texture_size")
+        box.prop(context.scene, "texel_target_density")
+        box.prop(context.scene, "texel_tolerance")
         box.operator("object.uv_texture_scale_checker", text = 'Check World Scale UV', icon = 'STICKY_UVS_VERT')
+        box.operator("object.uv_texel_density_heatmap", text = 'Texel Density Heatmap', icon = 'COLOR')
         box.operator("object.auto_scale_uv", text = 'World Scale UV', icon = 'UV_DATA')
         
         col.label(text='Name Check:')
@@ -3124,6 +4768,7 @@ class VIEW3D_PT_Panel66(Panel):
         # Create a box
         box66 = col.box()
         
+        box66.prop(context.scene, "vertex_color_domain", expand=True)
         box66.operator("object.create_vertex_colors", text = 'Create Vertex Color Channels RGBA', icon = 'COLOR')
         box66.operator("object.vertex_color", text = 'Radial Vertex Color Gradient RGBA', icon = 'FORCE_WIND')
         box66.operator("object.combine_vertex_colors", text = 'Combine Vertex Color RGBA', icon = 'GROUP_VERTEX')
@@ -3246,6 +4891,7 @@ class VIEW3D_PT_Panel07(Panel):
         box7.operator("object.seams_from_islands", text = 'Seams From Islands', icon = 'UV_ISLANDSEL')
         box7.operator("uv.project_from_vieww", text = 'Multi Project From View UVs', icon = 'MOD_UVPROJECT')
         box7.operator("object.uv_world_scale_checker", text = 'Check World Scale UV', icon = 'STICKY_UVS_VERT')
+        box7.prop(context.scene, "texel_density_preset", text="")
         box7.operator("object.auto_scale_uv", text = 'World Scale UV', icon = 'UV_DATA')
         box7.operator("object.merge_materials", text = 'Merge Duplicates Materials', icon = 'MATERIAL_DATA')
         
@@ -3281,7 +4927,10 @@ class VIEW3D_PT_Panel01(Panel):
         box2.operator("mesh.find_flip_uv", text = 'Find UV Flipped', icon = 'STICKY_UVS_LOC')
         box2.operator("mesh.fix_uv_flipped", text = 'Fix UV Flipped', icon = 'UV_SYNC_SELECT')
         
+        box2.prop(context.scene, "texel_density_preset", text="")
+        box2.prop(context.scene, "texel_tolerance")
         box2.operator("object.uv_texture_scale_checker", text = 'Check World Scale UV', icon = 'STICKY_UVS_VERT')
+        box2.operator("object.uv_texel_density_heatmap", text = 'Texel Density Heatmap', icon = 'COLOR')
         
         col.split()
         col.split()
@@ -3432,6 +5081,7 @@ classes = (
     ToggleBackfaceCullingOperator,
     ZFightDetector,
     UVTextureScaleCheckerOperator,
+    UVTexelDensityHeatmapOperator,
     MeshNameChecker,
     VIEW3D_PT_Panel_Controller,
     ToggleFaceOrientation,
@@ -3443,6 +5093,7 @@ classes = (
     MESH_OT_fix_flipped_uv_faces,
     MESH_OT_batch_decimate,
     MESH_OT_batch_decimate_planar,
+    MESH_OT_generate_lod_chain,
     OBJECT_OT_SeparateByVertexGroup,
     OBJECT_OT_VertexGroupCreate,
     OBJECT_OT_ExportMultipleOBJ,
@@ -3543,6 +5194,93 @@ def register():
     bpy.types.Scene.pack_islands_scale = bpy.props.BoolProperty(name="Scale", default=True)
     bpy.types.Scene.pack_islands_margin = bpy.props.FloatProperty(name="Margin", default=0.05, min=0.0, max=1.0)
 
+    bpy.types.Scene.texel_density_preset = EnumProperty(
+        name="Texel Density Preset",
+        description="Texture size and target density used by the texel density tools",
+        items=[
+            ('TEX_512', "512 px - 256 px/m", ""),
+            ('TEX_1024', "1024 px - 512 px/m", ""),
+            ('TEX_2048', "2048 px - 1024 px/m", ""),
+            ('TEX_4096', "4096 px - 2048 px/m", ""),
+            ('CUSTOM', "Custom", "Use the texture size and density set below"),
+        ],
+        default='TEX_2048',
+        update=update_texel_density_preset
+    )
+    bpy.types.Scene.texel_texture_size = IntProperty(name="Texture Size", default=2048, min=1, update=update_texel_density_values)
+    bpy.types.Scene.texel_target_density = FloatProperty(name="Target Density", description="Texel density in pixels per meter", default=1024.0, min=0.001, update=update_texel_density_values)
+    bpy.types.Scene.texel_tolerance = FloatProperty(name="Tolerance", description="Allowed deviation from the target density in percent", default=1.0, min=0.0, subtype='PERCENTAGE')
+
+    bpy.types.Scene.vertex_color_domain = EnumProperty(
+        name="Vertex Color Domain",
+        description="Domain of the vertex color channels created by the vertex color tools",
+        items=[
+            ('CORNER', "Face Corner", "One color per face corner, like the legacy vertex colors"),
+            ('POINT', "Vertex", "One color per vertex, smaller buffers for export and bake"),
+        ],
+        default='CORNER'
+    )
+
+    bpy.types.Scene.use_modifier_stack = BoolProperty(
+        name="Single Evaluation",
+        description="Stack all decimation modifiers and bake them with one depsgraph evaluation instead of applying them one by one",
+        default=True
+    )
+
+    bpy.types.Scene.decimate_parallel = BoolProperty(
+        name="Parallel",
+        description="Decimate in background Blender processes, one per worker",
+        default=False
+    )
+    bpy.types.Scene.decimate_workers = IntProperty(
+        name="Workers",
+        description="Number of background Blender processes",
+        default=max(1, (os.cpu_count() or 2) // 2),
+        min=1,
+        max=64
+    )
+
+    bpy.types.Scene.lod_mode = EnumProperty(
+        name="LOD Mode",
+        items=[
+            ('RATIO', "Ratios", "Each value is the fraction of the original triangles"),
+            ('TRIANGLES', "Triangles", "Each value is the target triangle count"),
+        ],
+        default='RATIO'
+    )
+    bpy.types.Scene.lod_levels = StringProperty(
+        name="Levels",
+        description="Comma separated values for LOD1..LODn, in descending order",
+        default="0.5, 0.25, 0.125"
+    )
+
+    bpy.types.Scene.use_triangle_budget = BoolProperty(
+        name="Triangle Budget",
+        description="Split a total triangle budget between the meshes of the collection instead of using one ratio",
+        default=False
+    )
+    bpy.types.Scene.triangle_budget = IntProperty(
+        name="Budget",
+        description="Total triangles of the collection after decimation",
+        default=100000,
+        min=1
+    )
+    bpy.types.Scene.budget_weighting = EnumProperty(
+        name="Weighting",
+        items=[
+            ('TRIANGLES', "Triangle Count", "Every mesh keeps the same share of its triangles"),
+            ('SCREEN_SIZE', "Screen Size", "Bigger meshes keep more triangles"),
+        ],
+        default='TRIANGLES'
+    )
+    bpy.types.Scene.budget_tolerance = FloatProperty(
+        name="Tolerance",
+        description="Accepted deviation from the budget in percent",
+        default=5.0,
+        min=0.0,
+        subtype='PERCENTAGE'
+    )
+
 def unregister():
     bpy.types.Scene.decimate_ratio = FloatProperty(
     name="Decimate Ratio",
@@ -3597,6 +5335,22 @@ def unregister():
     bpy.types.Scene.pack_islands_scale = bpy.props.BoolProperty(name="Allow Scaling", default=True)
     bpy.types.Scene.pack_islands_margin = bpy.props.FloatProperty(name="Margin", default=0.05, min=0.0, max=1.0)
     
+    uv_island_cache.clear()
+    
+    del bpy.types.Scene.texel_density_preset
+    del bpy.types.Scene.texel_texture_size
+    del bpy.types.Scene.texel_target_density
+    del bpy.types.Scene.texel_tolerance
+    del bpy.types.Scene.vertex_color_domain
+    del bpy.types.Scene.use_modifier_stack
+    del bpy.types.Scene.decimate_parallel
+    del bpy.types.Scene.decimate_workers
+    del bpy.types.Scene.lod_mode
+    del bpy.types.Scene.lod_levels
+    del bpy.types.Scene.use_triangle_budget
+    del bpy.types.Scene.triangle_budget
+    del bpy.types.Scene.budget_weighting
+    del bpy.types.Scene.budget_tolerance
     del bpy.types.Scene.decimate_ratio
     del bpy.types.Scene.collection_to_process
     del bpy.types.Scene.meshes_to_process
@@ -0,0 +1,187 @@
+"""Property-based checks for the flipped UV detector on synthetic meshes.
+
+Run inside Blender:
+
+    blender --background --factory-startup --python tests/test_uv_flips.py
+
+Every case builds random simple polygons (convex and concave, optionally
+non-planar), places them with a random rotation and gives them UVs that are
+either the planar layout of the polygon or its mirror. The detector must
+flag exactly the mirrored ones.
+"""
+
+import importlib.util
+import math
+import os
+import random
+import sys
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+if bpy is None and __name__ != "__main__":
+    import pytest
+    pytest.skip("requires Blender: blender --background --python tests/test_uv_flips.py", allow_module_level=True)
+
+import numpy as np
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "__init__.py")
+SEEDS = range(5)
+POLYGONS_PER_MESH = 200
+
+
+def load_addon():
+    spec = importlib.util.spec_from_file_location("smth_smart_tools_tests", ADDON_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+addon = load_addon() if bpy is not None else None
+
+
+def random_rotation(rng):
+    """Uniform random rotation matrix (determinant +1)."""
+    q, r = np.linalg.qr(np.array([[rng.gauss(0, 1) for _ in range(3)] for _ in range(3)]))
+    q = q * np.sign(np.diag(r))
+    if np.linalg.det(q) < 0:
+        q[:, 0] = -q[:, 0]
+    return q
+
+
+def random_polygon(rng, concave):
+    """Star-shaped simple polygon in the XY plane, counter-clockwise."""
+    sides = rng.randint(3, 9) if not concave else rng.randint(5, 10)
+    # Angoli in ordine con variazione limitata: nessun salto supera pi greco,
+    # quindi l'origine resta nel nucleo e il poligono è semplice e antiorario
+    angles = [2 * math.pi * (index + rng.uniform(0, 0.4)) / sides for index in range(sides)]
+    points = []
+    for index, angle in enumerate(angles):
+        if concave:
+            radius = 1.0 if index % 2 == 0 else rng.uniform(0.25, 0.55)
+        else:
+            radius = 1.0
+        points.append((radius * math.cos(angle), radius * math.sin(angle)))
+    return np.array(points)
+
+
+def build_case(rng, concave, non_planar, layers=1):
+    """Mesh of separate random polygons and the expected flips for each UV layer."""
+    verts = []
+    faces = []
+    uv_layers = [[] for _ in range(layers)]
+    expected = [[] for _ in range(layers)]
+
+    for _ in range(POLYGONS_PER_MESH):
+        points = random_polygon(rng, concave and rng.random() < 0.7)
+        heights = np.zeros(len(points))
+        if non_planar:
+            heights = np.array([rng.uniform(-0.15, 0.15) for _ in points])
+
+        rotation = random_rotation(rng)
+        offset = np.array([rng.uniform(-50, 50) for _ in range(3)])
+        local = np.column_stack((points, heights))
+        start = len(verts)
+        verts.extend((local @ rotation.T + offset).tolist())
+        faces.append(list(range(start, start + len(points))))
+
+        for layer in range(layers):
+            flipped = rng.random() < 0.5
+            scale = rng.uniform(0.05, 2.0)
+            uv = points * scale
+            if flipped:
+                uv[:, 0] = -uv[:, 0]
+            uv += np.array([rng.uniform(-1, 1), rng.uniform(-1, 1)])
+            uv_layers[layer].extend(uv.tolist())
+            expected[layer].append(flipped)
+
+    mesh = bpy.data.meshes.new("uv_flip_case")
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+    for layer, uvs in enumerate(uv_layers):
+        uv_layer = mesh.uv_layers.new(name="UVMap" if layer == 0 else f"UVMap_{layer}")
+        uv_layer.data.foreach_set("uv", np.array(uvs, dtype=np.float32).ravel())
+    mesh.uv_layers.active = mesh.uv_layers[0]
+    mesh.update()
+
+    return mesh, [np.array(flags) for flags in expected]
+
+
+def check_detector(concave, non_planar):
+    for seed in SEEDS:
+        rng = random.Random(seed)
+        mesh, expected = build_case(rng, concave, non_planar)
+        try:
+            flipped, counts = addon.find_flipped_uv_faces(mesh, use_normals=True)
+            mismatches = np.flatnonzero(flipped != expected[0])
+            assert not len(mismatches), f"seed {seed}: wrong result on faces {mismatches[:10].tolist()}"
+            assert counts == {"UVMap": int(expected[0].sum())}
+        finally:
+            bpy.data.meshes.remove(mesh)
+
+
+def test_convex_polygons():
+    check_detector(concave=False, non_planar=False)
+
+
+def test_concave_polygons():
+    check_detector(concave=True, non_planar=False)
+
+
+def test_non_planar_polygons():
+    check_detector(concave=True, non_planar=True)
+
+
+def test_corner_engine_matches_known_answer():
+    rng = random.Random(42)
+    mesh, expected = build_case(rng, concave=True, non_planar=True)
+    try:
+        buffers = addon.read_mesh_buffers(mesh)
+        normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+        mesh.polygons.foreach_get("normal", normals)
+        uv = addon.read_uv_buffer(mesh, mesh.uv_layers.active)
+        flipped = addon.uv_corner_flips(uv, buffers, normals.reshape(-1, 3).astype(np.float64))
+        assert np.array_equal(flipped, expected[0])
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+
+def test_all_uv_layers_are_checked():
+    rng = random.Random(7)
+    mesh, expected = build_case(rng, concave=True, non_planar=False, layers=2)
+    try:
+        flipped, counts = addon.find_flipped_uv_faces(mesh)
+        assert np.array_equal(flipped, expected[0] | expected[1])
+        assert counts == {"UVMap": int(expected[0].sum()), "UVMap_1": int(expected[1].sum())}
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+
+def test_shoelace_engine_on_planar_polygons():
+    rng = random.Random(3)
+    mesh, expected = build_case(rng, concave=True, non_planar=False)
+    try:
+        flipped, _ = addon.find_flipped_uv_faces(mesh, use_normals=False)
+        assert np.array_equal(flipped, expected[0])
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+
+def main():
+    tests = [(name, test) for name, test in sorted(globals().items()) if name.startswith("test_") and callable(test)]
+    failures = 0
+    for name, test in tests:
+        try:
+            test()
+            print(f"PASS {name}")
+        except Exception as e:
+            failures += 1
+            print(f"FAIL {name}: {e}")
+    print(f"{len(tests) - failures}/{len(tests)} passed")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)